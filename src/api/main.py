@@ -12,6 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from src.config.settings import settings
 from src.db.database import init_db
+from src.llm.router import close_http_client
 
 
 @asynccontextmanager
@@ -40,6 +41,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
     # Shutdown
     print("👋 Shutting down Social Media Post Generation Agent System")
+    close_http_client()
 
 
 def create_app() -> FastAPI:
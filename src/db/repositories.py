@@ -6,11 +6,20 @@ all database operations with a clean interface.
 
 from datetime import datetime
 
+from sqlalchemy import case, func, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from src.db.models import Evaluation, Post, PostContent, Review
 
 
+def _now() -> datetime:
+    """Return the current UTC time used for ``updated_at`` stamps.
+
+    Kept as a module-level hook so tests can control the clock.
+    """
+    return datetime.utcnow()
+
+
 class PostRepository:
     """Repository for Post model operations.
 
@@ -26,17 +35,29 @@ class PostRepository:
         """
         self.db = db
 
-    def create(self, topic: str, status: str = "draft") -> Post:
+    def create(
+        self,
+        topic: str,
+        status: str = "draft",
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+    ) -> Post:
         """Create a new post.
 
         Args:
             topic: Post topic
             status: Initial status (default: draft)
+            created_at: Explicit creation timestamp (default: now)
+            updated_at: Explicit last-update timestamp (default: now)
 
         Returns:
             Created Post instance
         """
         post = Post(topic=topic, status=status)
+        if created_at is not None:
+            post.created_at = created_at
+        if updated_at is not None:
+            post.updated_at = updated_at
         self.db.add(post)
         self.db.commit()
         self.db.refresh(post)
@@ -51,7 +72,10 @@ class PostRepository:
         Returns:
             Post instance or None if not found
         """
-        return self.db.query(Post).filter(Post.id == post_id).first()
+        # Lambda statement: construction and cache-key generation happen once,
+        # later calls only rebind post_id
+        stmt = lambda_stmt(lambda: select(Post).where(Post.id == post_id))
+        return self.db.execute(stmt).scalars().first()
 
     def get_all(
         self,
@@ -74,6 +98,29 @@ class PostRepository:
             query = query.filter(Post.status == status)
         return query.offset(skip).limit(limit).all()
 
+    def get_all_topics(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: str | None = None,
+    ) -> list[str]:
+        """Get post topics with the same paging and filtering as get_all.
+
+        Selects only the topic column, so no Post instances are built.
+
+        Args:
+            skip: Number of records to skip (pagination)
+            limit: Maximum number of records to return
+            status: Optional status filter
+
+        Returns:
+            List of topic strings
+        """
+        stmt = select(Post.topic)
+        if status:
+            stmt = stmt.where(Post.status == status)
+        return list(self.db.scalars(stmt.offset(skip).limit(limit)))
+
     def update_status(self, post_id: int, status: str) -> Post | None:
         """Update post status.
 
@@ -87,7 +134,7 @@ class PostRepository:
         post = self.get_by_id(post_id)
         if post:
             post.status = status
-            post.updated_at = datetime.utcnow()
+            post.updated_at = _now()
             self.db.commit()
             self.db.refresh(post)
         return post
@@ -105,7 +152,7 @@ class PostRepository:
         post = self.get_by_id(post_id)
         if post:
             post.image_url = image_url
-            post.updated_at = datetime.utcnow()
+            post.updated_at = _now()
             self.db.commit()
             self.db.refresh(post)
         return post
@@ -135,7 +182,7 @@ class PostRepository:
         Returns:
             Number of posts with given status
         """
-        return self.db.query(Post).filter(Post.status == status).count()
+        return self.db.query(func.count(Post.id)).filter(Post.status == status).scalar()
 
 
 class PostContentRepository:
@@ -334,11 +381,13 @@ class ReviewRepository:
         Returns:
             Approval rate (0-1)
         """
-        total = self.db.query(Review).count()
+        total, approved = self.db.query(
+            func.count(Review.id),
+            func.sum(case((Review.action == "approve", 1), else_=0)),
+        ).one()
         if total == 0:
             return 0.0
 
-        approved = self.db.query(Review).filter(Review.action == "approve").count()
         return approved / total
 
 
@@ -436,8 +485,6 @@ class EvaluationRepository:
         Returns:
             Average score
         """
-        from sqlalchemy import func
-
         result = (
             self.db.query(func.avg(Evaluation.score))
             .filter(Evaluation.metric_name == metric_name)
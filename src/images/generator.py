@@ -360,7 +360,7 @@ class ImageGenerator:
             # Use ImageStorage to save to final location
             from src.images.storage import ImageStorage
 
-            storage = ImageStorage()
+            storage = ImageStorage(str(self.storage_path))
             final_path = storage.save_image(
                 source_path=temp_path, post_id=post_id, format=settings.image_format
             )
@@ -422,7 +422,7 @@ class ImageGenerator:
             # Use ImageStorage to save to final location
             from src.images.storage import ImageStorage
 
-            storage = ImageStorage()
+            storage = ImageStorage(str(self.storage_path))
             final_path = storage.save_image(
                 source_path=temp_path, post_id=post_id, format=settings.image_format
             )
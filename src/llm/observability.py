@@ -4,12 +4,37 @@ This module provides observability for all LLM calls and agent executions
 using Langfuse, enabling debugging, monitoring, and cost tracking.
 """
 
-from typing import Any
-
-from langfuse import Langfuse
+import atexit
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Literal
 
 from src.config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+# Upper bound per buffer; under sustained overload the oldest traces are dropped
+MAX_BUFFERED_TRACES = 10_000
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Accept any trace call and do nothing (observability disabled)."""
+
+
+@dataclass(slots=True)
+class TraceRecord:
+    """A buffered trace waiting to be sent to Langfuse.
+
+    Attributes:
+        kind: Langfuse client method that records it
+        payload: Keyword arguments for that method
+    """
+
+    kind: Literal["generation", "trace", "event"]
+    payload: dict[str, Any]
+
 
 class ObservabilityManager:
     """Manager for Langfuse observability and tracing.
@@ -19,6 +44,11 @@ class ObservabilityManager:
     - Agent workflow executions
     - Custom events (image generation, human review, etc.)
 
+    Traces are not sent on the caller's thread. They are appended to an
+    in-memory buffer that a background writer drains every
+    ``flush_interval`` seconds, so tracing never blocks the LLM path on
+    Langfuse ingestion. Call flush() to send pending traces immediately.
+
     Example:
         obs = ObservabilityManager()
         obs.trace_llm_call(
@@ -30,18 +60,49 @@ class ObservabilityManager:
         )
     """
 
-    def __init__(self):
-        """Initialize Langfuse client if credentials are available."""
+    def __init__(self, flush_interval: float = 1.0):
+        """Initialize Langfuse client if credentials are available.
+
+        Args:
+            flush_interval: Seconds between background buffer drains
+        """
         self.enabled = bool(settings.langfuse_public_key and settings.langfuse_secret_key)
+        self.flush_interval = flush_interval
+
+        # Double buffer: callers append to the active one while the writer
+        # drains the other, so producers only contend on a cheap swap.
+        self._buffers: tuple[deque[TraceRecord], deque[TraceRecord]] = (
+            deque(maxlen=MAX_BUFFERED_TRACES),
+            deque(maxlen=MAX_BUFFERED_TRACES),
+        )
+        self._active = 0
+        self._swap_lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._writer: threading.Thread | None = None
 
         if self.enabled:
+            # Imported only when tracing is configured; langfuse is slow to import
+            from langfuse import Langfuse
+
             self.client = Langfuse(
                 public_key=settings.langfuse_public_key,
                 secret_key=settings.langfuse_secret_key,
                 host=settings.langfuse_host,
             )
+            self._writer = threading.Thread(
+                target=self._run_writer, name="langfuse-trace-writer", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.close)
         else:
             self.client = None
+            # Disabled: replace the public methods so calls skip argument
+            # handling and payload construction entirely
+            self.trace_llm_call = _noop
+            self.trace_agent_execution = _noop
+            self.trace_custom_event = _noop
+            self.flush = _noop
 
     def trace_llm_call(
         self,
@@ -62,18 +123,20 @@ class ObservabilityManager:
             latency_ms: Latency in milliseconds
             metadata: Additional metadata (post_id, platform, etc.)
         """
-        if not self.enabled:
-            return
-
-        if self.client:
-            self.client.generation(
-                name="llm_call",
-                model=model,
-                input=prompt,
-                output=response,
-                usage={"total_tokens": tokens},
-                metadata=metadata or {},
+        self._emit(
+            TraceRecord(
+                "generation",
+                {
+                    "name": "llm_call",
+                    "model": model,
+                    "input": prompt,
+                    "output": response,
+                    "usage": {"total_tokens": tokens},
+                    # Copied now: the writer thread reads it up to flush_interval later
+                    "metadata": dict(metadata or {}),
+                },
             )
+        )
 
     def trace_agent_execution(
         self,
@@ -92,23 +155,16 @@ class ObservabilityManager:
             duration_ms: Total execution time
             metadata: Additional metadata
         """
-        if not self.enabled:
-            return
+        # Caller metadata takes precedence; copied so later caller changes don't leak in
+        trace_metadata = {
+            "post_id": post_id,
+            "topic": topic,
+            "status": status,
+            "duration_ms": duration_ms,
+            **(metadata or {}),
+        }
 
-        if self.client:
-            trace_metadata = {
-                "post_id": post_id,
-                "topic": topic,
-                "status": status,
-                "duration_ms": duration_ms,
-            }
-            if metadata:
-                trace_metadata.update(metadata)
-
-            self.client.trace(
-                name="agent_execution",
-                metadata=trace_metadata,
-            )
+        self._emit(TraceRecord("trace", {"name": "agent_execution", "metadata": trace_metadata}))
 
     def trace_custom_event(
         self,
@@ -123,23 +179,67 @@ class ObservabilityManager:
             post_id: Related post ID
             data: Event data
         """
-        if not self.enabled:
-            return
-
-        if self.client:
-            event_metadata = {"post_id": post_id}
-            event_metadata.update(data)
+        event_metadata = {"post_id": post_id, **data}
 
-            self.client.event(
-                name=event_name,
-                metadata=event_metadata,
-            )
+        self._emit(TraceRecord("event", {"name": event_name, "metadata": event_metadata}))
 
     def flush(self) -> None:
-        """Flush any pending traces to Langfuse."""
+        """Send all buffered traces and flush the Langfuse client."""
         if self.enabled and self.client:
+            self._drain()
             self.client.flush()
 
+    def close(self) -> None:
+        """Stop the background writer and send any remaining traces."""
+        if self._writer is not None:
+            self._stop.set()
+            self._writer.join()
+            self._writer = None
+            self.flush()
+            atexit.unregister(self.close)
+
+    def _emit(self, record: TraceRecord) -> None:
+        """Buffer a trace for the background writer.
+
+        Disabled managers never get here (their trace_* methods are no-ops);
+        the check guards direct calls.
+
+        Args:
+            record: Trace to send
+        """
+        if not self.enabled:
+            return
+
+        with self._swap_lock:
+            self._buffers[self._active].append(record)
+
+    def _swap_buffers(self) -> deque[TraceRecord]:
+        """Make the idle buffer active and return the one holding pending traces.
+
+        Returns:
+            Buffer of TraceRecord entries to send
+        """
+        with self._swap_lock:
+            pending = self._buffers[self._active]
+            self._active ^= 1
+        return pending
+
+    def _drain(self) -> None:
+        """Send every pending trace to Langfuse."""
+        with self._drain_lock:
+            pending = self._swap_buffers()
+            while pending:
+                record = pending.popleft()
+                try:
+                    getattr(self.client, record.kind)(**record.payload)
+                except Exception as e:
+                    logger.warning(f"Failed to send Langfuse {record.kind}: {e}")
+
+    def _run_writer(self) -> None:
+        """Drain the trace buffer every flush_interval seconds until closed."""
+        while not self._stop.wait(self.flush_interval):
+            self._drain()
+
 
 # Global observability manager instance
 observability = ObservabilityManager()
@@ -4,19 +4,174 @@ This module provides intelligent routing to multiple LLM providers via OpenRoute
 with automatic fallback and retry logic for resilience.
 """
 
+import asyncio
 import logging
+import random
+import threading
 import time
-from typing import TypeVar
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, TypeVar
 
-from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
 from src.config.settings import settings
 
+if TYPE_CHECKING:
+    # Imported lazily in _build_client: langchain_openai is slow to import
+    import httpx
+    from langchain_openai import ChatOpenAI
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+OPENROUTER_API_BASE = "https://openrouter.ai/api/v1"
+
+# HTTP statuses that will not succeed on retry (bad request, auth, unknown model)
+_NON_RETRYABLE_STATUS_CODES = frozenset({400, 401, 403, 404})
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Check whether retrying the same model could succeed after this error.
+
+    Args:
+        error: Exception raised by the model call
+
+    Returns:
+        False for client errors such as openai.AuthenticationError, True otherwise
+    """
+    return getattr(error, "status_code", None) not in _NON_RETRYABLE_STATUS_CODES
+
+
+def _is_transient(error: Exception) -> bool:
+    """Check whether an error says the model is unhealthy rather than the request is bad.
+
+    Client errors and output validation failures (ValueError, which covers
+    pydantic.ValidationError) are specific to one prompt and should not make
+    the model look down for every other prompt.
+
+    Args:
+        error: Exception raised by the model call
+
+    Returns:
+        True for timeouts, connection errors, rate limits and 5xx responses
+    """
+    return _is_retryable(error) and not isinstance(error, ValueError)
+
+
+def _chain_exhausted(last_error: Exception) -> RuntimeError:
+    """Build the error raised once every model in the fallback chain has failed.
+
+    Shared by all generation entry points so callers catch one exception type.
+
+    Args:
+        last_error: Exception raised by the last model tried
+
+    Returns:
+        RuntimeError naming the last model's error, to be raised from it
+    """
+    return RuntimeError(f"All models in fallback chain failed: {last_error}")
+
+
+@lru_cache(maxsize=32)
+def _system_prefix(system_prompt: str | None) -> tuple[dict[str, str], ...]:
+    """Build the system message prefix for a prompt, cached per system prompt.
+
+    Agent nodes reuse a handful of fixed system prompts, so the message dict
+    is built once per prompt text. Callers must not mutate the result.
+
+    Args:
+        system_prompt: System prompt, or None/empty for no system message
+
+    Returns:
+        Tuple holding the system message, or an empty tuple
+    """
+    return ({"role": "system", "content": system_prompt},) if system_prompt else ()
+
+
+# Process-wide HTTP client, created on first use by _shared_http_client
+_http_client: "httpx.Client | None" = None
+_http_client_lock = threading.Lock()
+
+
+def _shared_http_client() -> "httpx.Client":
+    """Get the HTTP client shared by every ChatOpenAI instance.
+
+    All models are served from OpenRouter, so one keep-alive pool lets
+    retries and fallback hops reuse already-open connections. Creation is
+    guarded by a lock so concurrent first calls (e.g. from generate_batch
+    workers) never build, and leak, a second pool.
+
+    Returns:
+        Process-wide httpx client
+    """
+    global _http_client
+    client = _http_client
+    if client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                import httpx
+
+                _http_client = httpx.Client(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+                )
+            client = _http_client
+    return client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client, e.g. on application shutdown.
+
+    Cached ChatOpenAI clients are dropped too, so later calls rebuild both.
+    """
+    global _http_client
+    with _http_client_lock:
+        client, _http_client = _http_client, None
+    if client is not None:
+        client.close()
+    _build_client.cache_clear()
+
+
+# Circuit breaker shared by every router, since callers build a new LLMRouter per
+# call: model -> time.monotonic() deadline until which the model is skipped
+_cooldowns: dict[str, float] = {}
+_cooldowns_lock = threading.Lock()
+
+
+@lru_cache(maxsize=16)
+def _build_client(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    api_key: str,
+    api_base: str,
+) -> "ChatOpenAI":
+    """Build a ChatOpenAI client, memoized on its full configuration.
+
+    Args:
+        model: Model identifier
+        temperature: Generation temperature
+        max_tokens: Maximum tokens to generate
+        api_key: OpenRouter API key
+        api_base: OpenAI-compatible API base URL
+
+    Returns:
+        Configured ChatOpenAI client
+    """
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(
+        model=model,
+        openai_api_key=api_key,
+        openai_api_base=api_base,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        http_client=_shared_http_client(),
+    )
+
 
 class LLMRouter:
     """Router for LLM calls with fallback chain and retry logic.
@@ -36,6 +191,11 @@ class LLMRouter:
         fallback_models: list[str] | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        cooldown_seconds: float = 30.0,
+        retry_cap_seconds: float = 8.0,
+        retry_jitter: float = 0.5,
+        response_cache_size: int = 0,
+        response_cache_ttl: float = 300.0,
     ):
         """Initialize the LLM router.
 
@@ -44,17 +204,43 @@ class LLMRouter:
             fallback_models: List of fallback models (default from settings)
             temperature: Generation temperature (default from settings)
             max_tokens: Maximum tokens to generate (default from settings)
+            cooldown_seconds: How long to skip a model after a transient failure
+            retry_cap_seconds: Upper bound on the exponential part of retry backoff
+            retry_jitter: Maximum random seconds added to each retry backoff
+            response_cache_size: Max temperature-0 generate() responses to remember (0, the
+                default, disables caching)
+            response_cache_ttl: Seconds a cached generate() response stays valid
         """
         self.primary_model = primary_model or settings.primary_model
         self.fallback_models = fallback_models or settings.fallback_models_list
-        self.temperature = temperature or settings.llm_temperature
-        self.max_tokens = max_tokens or settings.llm_max_tokens
+        self.temperature = temperature if temperature is not None else settings.llm_temperature
+        self.max_tokens = max_tokens if max_tokens is not None else settings.llm_max_tokens
 
-        # Build model chain (primary + fallbacks)
-        self.model_chain = [self.primary_model] + self.fallback_models
+        # Build model chain (primary + fallbacks) once; generation iterates it as-is
+        self._model_chain: tuple[str, ...] = (self.primary_model, *self.fallback_models)
 
         # Retry configuration
         self.max_retries = 3
+        self.retry_cap_seconds = retry_cap_seconds
+        self.retry_jitter = retry_jitter
+
+        # Cooldown deadlines themselves live in the module-level _cooldowns
+        self.cooldown_seconds = cooldown_seconds
+
+        # Recent generate() responses: key -> (time.monotonic() expiry, text), LRU order
+        self.response_cache_size = response_cache_size
+        self.response_cache_ttl = response_cache_ttl
+        self._response_cache: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
+    @property
+    def model_chain(self) -> list[str]:
+        """Models tried in order: the primary model followed by the fallbacks.
+
+        Returns:
+            List of model identifiers
+        """
+        return list(self._model_chain)
 
     def generate(
         self,
@@ -65,6 +251,12 @@ class LLMRouter:
     ) -> str:
         """Generate text using LLM with fallback chain.
 
+        If the router was built with a response_cache_size, identical
+        deterministic requests (temperature 0, same prompt, system prompt and
+        max tokens) within response_cache_ttl seconds are answered from the
+        response cache. Sampled output is never cached, so regenerating a
+        prompt still yields fresh text.
+
         Args:
             prompt: User prompt for generation
             system_prompt: Optional system prompt for context
@@ -75,21 +267,168 @@ class LLMRouter:
             Generated text from the LLM
 
         Raises:
-            Exception: If all models in the chain fail
+            RuntimeError: If all models in the chain fail
         """
         temp = temperature if temperature is not None else self.temperature
         max_tok = max_tokens if max_tokens is not None else self.max_tokens
 
-        for model in self.model_chain:
+        cache_key = None
+        if temp == 0 and self.response_cache_size > 0:
+            cache_key = (system_prompt, prompt, max_tok)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+
+        last_error: Exception | None = None
+        for model in self._models_to_try():
             try:
                 response = self._call_model_with_retry(model, prompt, system_prompt, temp, max_tok)
                 logger.info(f"Successfully generated with {model}")
+                self._end_cooldown(model)
+                if cache_key is not None:
+                    self._cache_response(cache_key, response)
                 return response
             except Exception as e:
                 logger.warning(f"Model {model} failed: {e}")
-                continue
+                self._record_failure(model, e)
+                last_error = e
+
+        raise _chain_exhausted(last_error) from last_error
+
+    def stream_generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        """Stream generated text chunk by chunk using the fallback chain.
+
+        Chunks are yielded as soon as the model produces them, so callers can
+        show progress long before the full response is ready. A model that
+        fails before producing any output falls back to the next one; once
+        text has been yielded, a failure is raised rather than restarting on
+        another model, so callers never receive duplicated text.
+
+        Args:
+            prompt: User prompt for generation
+            system_prompt: Optional system prompt for context
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+
+        Yields:
+            Text chunks from the LLM
+
+        Raises:
+            RuntimeError: If all models in the chain fail before producing output
+            Exception: If a model fails mid-stream
+        """
+        temp = temperature if temperature is not None else self.temperature
+        max_tok = max_tokens if max_tokens is not None else self.max_tokens
+        messages = [*_system_prefix(system_prompt), {"role": "user", "content": prompt}]
 
-        raise Exception("All models in fallback chain failed")
+        last_error: Exception | None = None
+        for model in self._models_to_try():
+            client = self._create_client(model, temp, max_tok)
+            started = False
+            try:
+                for chunk in client.stream(messages):
+                    if chunk.content:
+                        started = True
+                        yield chunk.content
+                logger.info(f"Successfully streamed with {model}")
+                self._end_cooldown(model)
+                return
+            except Exception as e:
+                if started:
+                    raise
+                logger.warning(f"Model {model} failed to stream: {e}")
+                self._record_failure(model, e)
+                last_error = e
+
+        raise _chain_exhausted(last_error) from last_error
+
+    def generate_batch(
+        self,
+        prompts: Sequence[str],
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        max_workers: int = 8,
+    ) -> list[str]:
+        """Generate text for several prompts concurrently.
+
+        Each prompt goes through generate() (fallback chain and retries
+        included) on a thread pool, so the network waits overlap and the
+        batch takes roughly as long as its slowest prompt.
+
+        Args:
+            prompts: User prompts to generate for
+            system_prompt: Optional system prompt shared by every prompt
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            max_workers: Maximum number of concurrent generations
+
+        Returns:
+            Generated texts, in the same order as prompts
+
+        Raises:
+            RuntimeError: If any prompt fails on every model in the chain
+        """
+        if not prompts:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as executor:
+            return list(
+                executor.map(
+                    lambda prompt: self.generate(prompt, system_prompt, temperature, max_tokens),
+                    prompts,
+                )
+            )
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Generate text asynchronously using LLM with fallback chain.
+
+        Async counterpart of generate(). Retry backoff awaits instead of
+        blocking the thread, so concurrent generations can overlap while
+        one of them waits to retry.
+
+        Args:
+            prompt: User prompt for generation
+            system_prompt: Optional system prompt for context
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+
+        Returns:
+            Generated text from the LLM
+
+        Raises:
+            RuntimeError: If all models in the chain fail
+        """
+        temp = temperature if temperature is not None else self.temperature
+        max_tok = max_tokens if max_tokens is not None else self.max_tokens
+
+        last_error: Exception | None = None
+        for model in self._models_to_try():
+            try:
+                response = await self._acall_model_with_retry(
+                    model, prompt, system_prompt, temp, max_tok
+                )
+                logger.info(f"Successfully generated with {model}")
+                self._end_cooldown(model)
+                return response
+            except Exception as e:
+                logger.warning(f"Model {model} failed: {e}")
+                self._record_failure(model, e)
+                last_error = e
+
+        raise _chain_exhausted(last_error) from last_error
 
     def generate_structured(
         self,
@@ -116,7 +455,7 @@ class LLMRouter:
             Instance of response_model with validated data from LLM
 
         Raises:
-            Exception: If all models in the chain fail
+            RuntimeError: If all models in the chain fail
 
         Example:
             class MyOutput(BaseModel):
@@ -133,18 +472,109 @@ class LLMRouter:
         temp = temperature if temperature is not None else self.temperature
         max_tok = max_tokens if max_tokens is not None else self.max_tokens
 
-        for model in self.model_chain:
+        last_error: Exception | None = None
+        for model in self._models_to_try():
             try:
                 response = self._call_model_structured_with_retry(
                     model, prompt, response_model, system_prompt, temp, max_tok
                 )
                 logger.info(f"Successfully generated structured output with {model}")
+                self._end_cooldown(model)
                 return response
             except Exception as e:
                 logger.warning(f"Model {model} failed for structured output: {e}")
-                continue
+                self._record_failure(model, e)
+                last_error = e
 
-        raise Exception("All models in fallback chain failed for structured output")
+        raise _chain_exhausted(last_error) from last_error
+
+    def _get_cached_response(self, key: tuple) -> str | None:
+        """Look up an unexpired cached generate() response.
+
+        Args:
+            key: (system_prompt, prompt, max_tokens)
+
+        Returns:
+            Cached text, or None on a miss or expired entry
+        """
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._response_cache[key]
+                return None
+            self._response_cache.move_to_end(key)
+            return response
+
+    def _cache_response(self, key: tuple, response: str) -> None:
+        """Remember a generate() response, evicting the least recently used.
+
+        Args:
+            key: (system_prompt, prompt, max_tokens)
+            response: Generated text
+        """
+        with self._response_cache_lock:
+            self._response_cache[key] = (time.monotonic() + self.response_cache_ttl, response)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
+
+    def _models_to_try(self) -> tuple[str, ...]:
+        """Get the models of the chain that are not cooling down, in order.
+
+        If every model is cooling down, the one whose cooldown ends soonest is
+        still returned as a probe, so a transient outage never turns into
+        requests failing without any call being made.
+
+        Returns:
+            Model identifiers to try, never empty
+        """
+        # One snapshot for both checks: other threads may end cooldowns meanwhile
+        with _cooldowns_lock:
+            cooldown = dict(_cooldowns)
+        now = time.monotonic()
+        ready = tuple(m for m in self._model_chain if cooldown.get(m, 0.0) <= now)
+        if ready:
+            return ready
+        probe = min(self._model_chain, key=lambda m: cooldown.get(m, 0.0))
+        logger.warning(f"All models cooling down after recent failures, probing {probe}")
+        return (probe,)
+
+    def _record_failure(self, model: str, error: Exception) -> None:
+        """Skip a model for cooldown_seconds if it failed for a transient reason.
+
+        Args:
+            model: Model identifier
+            error: Exception the model's last attempt raised
+        """
+        if _is_transient(error):
+            with _cooldowns_lock:
+                _cooldowns[model] = time.monotonic() + self.cooldown_seconds
+
+    def _end_cooldown(self, model: str) -> None:
+        """Clear a model's cooldown after it succeeded, e.g. as a probe.
+
+        Args:
+            model: Model identifier
+        """
+        with _cooldowns_lock:
+            _cooldowns.pop(model, None)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Compute the sleep before the next retry.
+
+        Exponential backoff capped at retry_cap_seconds, plus random jitter so
+        concurrent callers failing together don't retry in lockstep.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+
+        Returns:
+            Seconds to wait before retrying
+        """
+        return min(self.retry_cap_seconds, 2**attempt) + random.random() * self.retry_jitter
 
     def _call_model_with_retry(
         self,
@@ -167,19 +597,55 @@ class LLMRouter:
             Generated text
 
         Raises:
-            Exception: If all retries fail
+            Exception: If all retries fail, or immediately on a non-retryable error
         """
         for attempt in range(self.max_retries):
             try:
                 return self._call_model(model, prompt, system_prompt, temperature, max_tokens)
-            except Exception:
-                if attempt < self.max_retries - 1:
-                    sleep_time = 2**attempt
-                    logger.debug(f"Retry {attempt + 1} after {sleep_time}s")
+            except Exception as e:
+                if attempt < self.max_retries - 1 and _is_retryable(e):
+                    sleep_time = self._backoff_delay(attempt)
+                    logger.debug(f"Retry {attempt + 1} after {sleep_time:.2f}s")
                     time.sleep(sleep_time)
                 else:
                     raise
 
+    async def _acall_model_with_retry(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Call model asynchronously with exponential backoff retry.
+
+        Args:
+            model: Model identifier
+            prompt: User prompt
+            system_prompt: System prompt
+            temperature: Generation temperature
+            max_tokens: Maximum tokens
+
+        Returns:
+            Generated text
+
+        Raises:
+            Exception: If all retries fail, or immediately on a non-retryable error
+        """
+        for attempt in range(self.max_retries):
+            try:
+                return await self._acall_model(
+                    model, prompt, system_prompt, temperature, max_tokens
+                )
+            except Exception as e:
+                if attempt < self.max_retries - 1 and _is_retryable(e):
+                    sleep_time = self._backoff_delay(attempt)
+                    logger.debug(f"Retry {attempt + 1} after {sleep_time:.2f}s")
+                    await asyncio.sleep(sleep_time)
+                else:
+                    raise
+
     def _call_model_structured_with_retry(
         self,
         model: str,
@@ -203,17 +669,17 @@ class LLMRouter:
             Pydantic model instance with validated data
 
         Raises:
-            Exception: If all retries fail
+            Exception: If all retries fail, or immediately on a non-retryable error
         """
         for attempt in range(self.max_retries):
             try:
                 return self._call_model_structured(
                     model, prompt, response_model, system_prompt, temperature, max_tokens
                 )
-            except Exception:
-                if attempt < self.max_retries - 1:
-                    sleep_time = 2**attempt
-                    logger.debug(f"Retry {attempt + 1} after {sleep_time}s")
+            except Exception as e:
+                if attempt < self.max_retries - 1 and _is_retryable(e):
+                    sleep_time = self._backoff_delay(attempt)
+                    logger.debug(f"Retry {attempt + 1} after {sleep_time:.2f}s")
                     time.sleep(sleep_time)
                 else:
                     raise
@@ -238,16 +704,40 @@ class LLMRouter:
         Returns:
             Generated text
         """
-        client = self._create_client(model)
+        client = self._create_client(model, temperature, max_tokens)
 
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = [*_system_prefix(system_prompt), {"role": "user", "content": prompt}]
 
         response = client.invoke(messages)
         return response.content
 
+    async def _acall_model(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Call a specific model asynchronously via OpenRouter.
+
+        Args:
+            model: Model identifier (e.g., "anthropic/claude-3.5-sonnet")
+            prompt: User prompt
+            system_prompt: System prompt
+            temperature: Generation temperature
+            max_tokens: Maximum tokens
+
+        Returns:
+            Generated text
+        """
+        client = self._create_client(model, temperature, max_tokens)
+
+        messages = [*_system_prefix(system_prompt), {"role": "user", "content": prompt}]
+
+        response = await client.ainvoke(messages)
+        return response.content
+
     def _call_model_structured(
         self,
         model: str,
@@ -278,10 +768,7 @@ class LLMRouter:
         # Configure client for structured output
         structured_client = client.with_structured_output(response_model)
 
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = [*_system_prefix(system_prompt), {"role": "user", "content": prompt}]
 
         response = structured_client.invoke(messages)
         return response
@@ -291,8 +778,13 @@ class LLMRouter:
         model: str,
         temperature: float | None = None,
         max_tokens: int | None = None,
-    ) -> ChatOpenAI:
-        """Create LangChain ChatOpenAI client for OpenRouter.
+    ) -> "ChatOpenAI":
+        """Get the LangChain ChatOpenAI client for OpenRouter.
+
+        Clients are shared process-wide per (model, temperature, max_tokens),
+        so repeated calls, including from different router instances, reuse
+        the same underlying HTTP connection pool instead of building a new
+        client for every prompt.
 
         Args:
             model: Model identifier
@@ -302,10 +794,10 @@ class LLMRouter:
         Returns:
             Configured ChatOpenAI client
         """
-        return ChatOpenAI(
-            model=model,
-            openai_api_key=settings.openrouter_api_key,
-            openai_api_base="https://openrouter.ai/api/v1",
-            temperature=temperature or self.temperature,
-            max_tokens=max_tokens or self.max_tokens,
+        return _build_client(
+            model,
+            temperature if temperature is not None else self.temperature,
+            max_tokens if max_tokens is not None else self.max_tokens,
+            settings.openrouter_api_key,
+            OPENROUTER_API_BASE,
         )
@@ -128,12 +128,12 @@ class TestCreateWorkflow:
 class TestWorkflowExecution:
     """Integration tests for workflow execution with mocked nodes."""
 
-    @patch("src.agent.nodes.analyze_topic")
-    @patch("src.agent.nodes.generate_image")
-    @patch("src.agent.nodes.generate_linkedin")
-    @patch("src.agent.nodes.generate_instagram")
-    @patch("src.agent.nodes.generate_wordpress")
-    @patch("src.agent.nodes.wait_for_approval")
+    @patch("src.agent.graph.analyze_topic")
+    @patch("src.agent.graph.generate_image")
+    @patch("src.agent.graph.generate_linkedin")
+    @patch("src.agent.graph.generate_instagram")
+    @patch("src.agent.graph.generate_wordpress")
+    @patch("src.agent.graph.wait_for_approval")
     def test_workflow_reaches_wait_for_approval(
         self,
         mock_wait,
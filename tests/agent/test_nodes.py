@@ -6,10 +6,6 @@ finalize, handle_error) and content generation nodes following TDD principles.
 
 from unittest.mock import MagicMock, patch
 
-import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
 from src.agent.llm_schemas import (
     InstagramContentOutput,
     LinkedInContentOutput,
@@ -29,29 +25,6 @@ from src.agent.nodes import (
 )
 from src.agent.schemas import ImageData, InstagramPost, LinkedInPost, WordPressPost
 from src.agent.state import PostGenerationState
-from src.db.models import Base
-
-# ===== Test Database Setup =====
-
-
-@pytest.fixture(scope="function")
-def db_session():
-    """Create a fresh database session for each test.
-
-    Yields:
-        SQLAlchemy Session
-    """
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(bind=engine)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-
-    try:
-        yield session
-    finally:
-        session.close()
-        Base.metadata.drop_all(bind=engine)
-
 
 # ===== Test wait_for_approval Node =====
 
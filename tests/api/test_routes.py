@@ -12,6 +12,7 @@ from sqlalchemy.orm import sessionmaker
 os.environ["OPENROUTER_API_KEY"] = "test-key-123"
 
 from src.api.main import create_app
+from src.api.routes import router
 from src.db.database import Base, get_db
 from src.db.repositories import PostContentRepository, PostRepository
 
@@ -19,9 +20,9 @@ from src.db.repositories import PostContentRepository, PostRepository
 SQLALCHEMY_DATABASE_URL = "sqlite:///file::memory:?cache=shared&uri=true"
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def db_engine():
-    """Create a fresh database engine for each test."""
+    """Create the database engine and schema once for this module."""
     engine = create_engine(
         SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False, "uri": True}
     )
@@ -33,12 +34,17 @@ def db_engine():
 
 @pytest.fixture
 def db(db_engine):
-    """Create a fresh database session for each test."""
+    """Create a database session for each test and empty all tables afterwards."""
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
     session = TestingSessionLocal()
     yield session
     session.close()
 
+    # Delete rows rather than dropping tables so the schema stays warm between tests
+    with db_engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+
 
 @pytest.fixture
 def client(db, db_engine, monkeypatch):
@@ -57,8 +63,6 @@ def client(db, db_engine, monkeypatch):
     app.dependency_overrides[get_db] = override_get_db
 
     # Register routes
-    from src.api.routes import router
-
     app.include_router(router, prefix="/api")
 
     # Mock SessionLocal in the database module to use test database session factory
@@ -1,12 +1,90 @@
 """Pytest configuration for all tests.
 
 This module sets up global test configuration including environment variables
-that need to be set before any application code is imported.
+that need to be set before any application code is imported, and the shared
+database fixtures used by any test that needs a session.
 """
 
 import os
 
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
 # Set required environment variables for testing
 # These must be set before any application code imports settings
 os.environ.setdefault("OPENROUTER_API_KEY", "test-key-for-testing")
 os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from src.db.models import Base
+
+# ===== Test Database Setup =====
+
+
+@pytest.fixture(scope="session")
+def _engine():
+    """Create the in-memory SQLite engine and schema once per test session.
+
+    Yields:
+        SQLAlchemy Engine with all tables created
+    """
+    # StaticPool hands out a single connection, so every checkout sees the same
+    # in-memory database instead of a fresh empty one
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT handling;
+    # take over transaction control so per-test rollbacks are reliable
+    @event.listens_for(engine, "connect")
+    def _configure_connection(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+        # Throwaway database: trade durability for speed
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.execute("PRAGMA cache_size=-20000")  # 20 MB page cache
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def db_session(_engine):
+    """Create an isolated database session for each test.
+
+    This fixture:
+    1. Opens a connection on the shared engine and begins an outer transaction
+    2. Binds a session that turns its own commits into SAVEPOINT releases
+    3. Yields the session for the test
+    4. Rolls back the outer transaction so no data leaks between tests
+
+    Yields:
+        SQLAlchemy Session
+    """
+    connection = _engine.connect()
+    transaction = connection.begin()
+
+    # Repository commits only release a SAVEPOINT; the outer transaction stays open
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
@@ -3,11 +3,13 @@
 This module contains comprehensive tests for all repository classes following TDD principles.
 """
 
+from datetime import datetime, timedelta
+
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import Select, func, insert, select
+from sqlalchemy.orm import Session
 
-from src.db.models import Base
+from src.db.models import Base, Evaluation, Post, PostContent, Review
 from src.db.repositories import (
     EvaluationRepository,
     PostContentRepository,
@@ -15,37 +17,50 @@ from src.db.repositories import (
     ReviewRepository,
 )
 
-# ===== Test Database Setup =====
+# ===== Test Helpers =====
+
+# Explicit timestamp for fixture rows whose timestamps no test inspects
+_FIXED_TIMESTAMP = datetime(2024, 1, 1)
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    """Create a fresh database session for each test.
+def _bulk_insert(session: Session, model: type[Base], rows: list[dict]) -> list:
+    """Insert several rows with one compiled INSERT executed over all parameter sets.
 
-    This fixture:
-    1. Creates an in-memory SQLite database
-    2. Creates all tables
-    3. Yields a session for the test
-    4. Cleans up after the test
+    Args:
+        session: Database session
+        model: Mapped model class to insert into
+        rows: Column values, one dict per row
 
-    Yields:
-        SQLAlchemy Session
+    Returns:
+        Created model instances with IDs assigned, in input order
     """
-    # Create in-memory database (fast, isolated)
-    engine = create_engine("sqlite:///:memory:")
+    stmt = insert(model).returning(model, sort_by_parameter_order=True)
+    return list(session.scalars(stmt, rows))
 
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
 
-    # Create session factory
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
+def _count_where(model: type[Base], *criteria) -> Select:
+    """Build a COUNT(*) query for rows of a model matching the given criteria.
 
-    try:
-        yield session
-    finally:
-        session.close()
-        Base.metadata.drop_all(bind=engine)
+    Args:
+        model: Mapped model class to count
+        *criteria: WHERE clause expressions
+
+    Returns:
+        Select statement returning a single integer
+    """
+    return select(func.count()).select_from(model).where(*criteria)
+
+
+@pytest.fixture
+def seed_post(db_session: Session) -> Post:
+    """Create the canonical post that related-record tests attach to.
+
+    Returns:
+        Persisted Post instance
+    """
+    return PostRepository(db_session).create(
+        topic="Test", created_at=_FIXED_TIMESTAMP, updated_at=_FIXED_TIMESTAMP
+    )
 
 
 # ===== PostRepository Tests =====
@@ -71,41 +86,50 @@ class TestPostRepository:
         assert post.created_at is not None
         assert post.updated_at is not None
 
-    def test_create_post_with_custom_status(self, db_session: Session):
-        """Test creating a post with custom status."""
+    def test_create_post_with_explicit_timestamps(self, db_session: Session):
+        """Test creating a post with caller-provided timestamps."""
         # Arrange
         repo = PostRepository(db_session)
 
         # Act
-        post = repo.create(topic="Test Topic", status="pending_review")
+        post = repo.create(
+            topic="Test Topic",
+            created_at=_FIXED_TIMESTAMP,
+            updated_at=_FIXED_TIMESTAMP + timedelta(hours=1),
+        )
 
         # Assert
-        assert post.status == "pending_review"
+        assert post.created_at == _FIXED_TIMESTAMP
+        assert post.updated_at == _FIXED_TIMESTAMP + timedelta(hours=1)
 
-    def test_get_by_id_existing(self, db_session: Session):
-        """Test retrieving an existing post by ID."""
+    def test_create_post_with_custom_status(self, db_session: Session):
+        """Test creating a post with custom status."""
         # Arrange
         repo = PostRepository(db_session)
-        created_post = repo.create(topic="Test Topic")
 
         # Act
-        retrieved_post = repo.get_by_id(created_post.id)
+        post = repo.create(topic="Test Topic", status="pending_review")
 
         # Assert
-        assert retrieved_post is not None
-        assert retrieved_post.id == created_post.id
-        assert retrieved_post.topic == created_post.topic
+        assert post.status == "pending_review"
 
-    def test_get_by_id_nonexistent(self, db_session: Session):
-        """Test retrieving a nonexistent post returns None."""
+    @pytest.mark.parametrize("exists", [True, False], ids=["existing", "nonexistent"])
+    def test_get_by_id(self, db_session: Session, exists: bool):
+        """Test retrieving a post by ID, returning None when it doesn't exist."""
         # Arrange
         repo = PostRepository(db_session)
+        post_id = repo.create(topic="Test Topic").id if exists else 999
 
         # Act
-        post = repo.get_by_id(999)
+        retrieved_post = repo.get_by_id(post_id)
 
         # Assert
-        assert post is None
+        if exists:
+            assert retrieved_post is not None
+            assert retrieved_post.id == post_id
+            assert retrieved_post.topic == "Test Topic"
+        else:
+            assert retrieved_post is None
 
     def test_get_all_empty(self, db_session: Session):
         """Test getting all posts when database is empty."""
@@ -126,8 +150,9 @@ class TestPostRepository:
         repo.create(topic="Post 2")
         repo.create(topic="Post 3")
 
-        # Act
-        posts = repo.get_all()
+        # Act (nothing is pending after the creates, so skip autoflush on read)
+        with db_session.no_autoflush:
+            posts = repo.get_all()
 
         # Assert
         assert len(posts) == 3
@@ -139,8 +164,9 @@ class TestPostRepository:
         """Test pagination with skip and limit."""
         # Arrange
         repo = PostRepository(db_session)
-        for i in range(10):
-            repo.create(topic=f"Post {i}")
+        _bulk_insert(
+            db_session, Post, [{"topic": f"Post {i}", "status": "draft"} for i in range(10)]
+        )
 
         # Act
         page_1 = repo.get_all(skip=0, limit=3)
@@ -152,6 +178,21 @@ class TestPostRepository:
         assert page_1[0].topic == "Post 0"
         assert page_2[0].topic == "Post 3"
 
+    def test_get_all_topics(self, db_session: Session):
+        """Test reading only topics with pagination and status filtering."""
+        # Arrange
+        repo = PostRepository(db_session)
+        _bulk_insert(
+            db_session,
+            Post,
+            [{"topic": f"Post {i}", "status": "draft" if i % 2 else "approved"} for i in range(6)],
+        )
+
+        # Act & Assert
+        assert repo.get_all_topics(skip=0, limit=3) == ["Post 0", "Post 1", "Post 2"]
+        assert repo.get_all_topics(skip=3, limit=3) == ["Post 3", "Post 4", "Post 5"]
+        assert repo.get_all_topics(status="approved") == ["Post 0", "Post 2", "Post 4"]
+
     def test_get_all_with_status_filter(self, db_session: Session):
         """Test filtering posts by status."""
         # Arrange
@@ -170,92 +211,79 @@ class TestPostRepository:
         assert all(p.status == "draft" for p in draft_posts)
         assert approved_posts[0].status == "approved"
 
-    def test_update_status_existing(self, db_session: Session):
-        """Test updating status of existing post."""
+    @pytest.mark.parametrize("exists", [True, False], ids=["existing", "nonexistent"])
+    def test_update_status(self, db_session: Session, monkeypatch, exists: bool):
+        """Test updating post status, returning None when the post doesn't exist."""
         # Arrange
         repo = PostRepository(db_session)
-        post = repo.create(topic="Test", status="draft")
-        original_updated_at = post.updated_at
+        post_id = 999
+        if exists:
+            post = repo.create(topic="Test", status="draft")
+            post_id = post.id
+            original_updated_at = post.updated_at
 
-        # Act (small delay to ensure different timestamp)
-        import time
-
-        time.sleep(0.01)
-        updated_post = repo.update_status(post.id, "approved")
-
-        # Assert
-        assert updated_post is not None
-        assert updated_post.status == "approved"
-        assert updated_post.updated_at > original_updated_at
-
-    def test_update_status_nonexistent(self, db_session: Session):
-        """Test updating status of nonexistent post returns None."""
-        # Arrange
-        repo = PostRepository(db_session)
+            # Advance the repository clock instead of sleeping
+            later = original_updated_at + timedelta(seconds=1)
+            monkeypatch.setattr("src.db.repositories._now", lambda: later)
 
         # Act
-        result = repo.update_status(999, "approved")
+        updated_post = repo.update_status(post_id, "approved")
 
         # Assert
-        assert result is None
+        if exists:
+            assert updated_post is not None
+            assert updated_post.status == "approved"
+            assert updated_post.updated_at == later
+            assert updated_post.updated_at > original_updated_at
+        else:
+            assert updated_post is None
 
-    def test_update_image_url_existing(self, db_session: Session):
-        """Test updating image URL."""
+    @pytest.mark.parametrize("exists", [True, False], ids=["existing", "nonexistent"])
+    def test_update_image_url(self, db_session: Session, exists: bool):
+        """Test updating image URL, returning None when the post doesn't exist."""
         # Arrange
         repo = PostRepository(db_session)
-        post = repo.create(topic="Test")
+        post_id = repo.create(topic="Test").id if exists else 999
         image_url = "/storage/images/12345.png"
 
         # Act
-        updated_post = repo.update_image_url(post.id, image_url)
+        updated_post = repo.update_image_url(post_id, image_url)
 
         # Assert
-        assert updated_post is not None
-        assert updated_post.image_url == image_url
+        if exists:
+            assert updated_post is not None
+            assert updated_post.image_url == image_url
+        else:
+            assert updated_post is None
 
-    def test_update_image_url_nonexistent(self, db_session: Session):
-        """Test updating image URL of nonexistent post."""
+    @pytest.mark.parametrize("exists", [True, False], ids=["existing", "nonexistent"])
+    def test_delete(self, db_session: Session, exists: bool):
+        """Test deleting a post, returning False when it doesn't exist."""
         # Arrange
         repo = PostRepository(db_session)
+        post_id = repo.create(topic="Test").id if exists else 999
 
         # Act
-        result = repo.update_image_url(999, "/path/to/image.png")
+        result = repo.delete(post_id)
 
         # Assert
-        assert result is None
-
-    def test_delete_existing(self, db_session: Session):
-        """Test deleting an existing post."""
-        # Arrange
-        repo = PostRepository(db_session)
-        post = repo.create(topic="Test")
-
-        # Act
-        result = repo.delete(post.id)
-
-        # Assert
-        assert result is True
-        assert repo.get_by_id(post.id) is None
-
-    def test_delete_nonexistent(self, db_session: Session):
-        """Test deleting a nonexistent post."""
-        # Arrange
-        repo = PostRepository(db_session)
-
-        # Act
-        result = repo.delete(999)
-
-        # Assert
-        assert result is False
+        assert result is exists
+        assert db_session.scalar(_count_where(Post, Post.id == post_id)) == 0
 
     def test_count_by_status(self, db_session: Session):
         """Test counting posts by status."""
         # Arrange
         repo = PostRepository(db_session)
-        repo.create(topic="Draft 1", status="draft")
-        repo.create(topic="Draft 2", status="draft")
-        repo.create(topic="Draft 3", status="draft")
-        repo.create(topic="Approved 1", status="approved")
+        _bulk_insert(
+            db_session,
+            Post,
+            [
+                {"topic": "Draft 1", "status": "draft"},
+                {"topic": "Draft 2", "status": "draft"},
+                {"topic": "Draft 3", "status": "draft"},
+                {"topic": "Approved 1", "status": "approved"},
+            ],
+        )
 
         # Act
         draft_count = repo.count_by_status("draft")
@@ -280,8 +308,7 @@ class TestPostRepository:
         post_repo.delete(post.id)
 
         # Assert
-        remaining_content = content_repo.get_by_post_id(post.id)
-        assert remaining_content == []
+        assert db_session.scalar(_count_where(PostContent, PostContent.post_id == post.id)) == 0
 
 
 # ===== PostContentRepository Tests =====
@@ -290,16 +317,14 @@ class TestPostRepository:
 class TestPostContentRepository:
     """Tests for PostContentRepository class."""
 
-    def test_create_content(self, db_session: Session):
+    def test_create_content(self, db_session: Session, seed_post: Post):
         """Test creating platform-specific content."""
         # Arrange
-        post_repo = PostRepository(db_session)
         content_repo = PostContentRepository(db_session)
-        post = post_repo.create(topic="Test")
 
         # Act
         content = content_repo.create(
-            post_id=post.id,
+            post_id=seed_post.id,
             platform="linkedin",
             content="Professional post for LinkedIn",
             metadata={"hashtags": ["AI", "ML"]},
@@ -307,22 +332,20 @@ class TestPostContentRepository:
 
         # Assert
         assert content.id is not None
-        assert content.post_id == post.id
+        assert content.post_id == seed_post.id
         assert content.platform == "linkedin"
         assert content.content == "Professional post for LinkedIn"
         assert content.extra_metadata == {"hashtags": ["AI", "ML"]}
         assert content.created_at is not None
 
-    def test_create_content_without_metadata(self, db_session: Session):
+    def test_create_content_without_metadata(self, db_session: Session, seed_post: Post):
         """Test creating content without metadata."""
         # Arrange
-        post_repo = PostRepository(db_session)
         content_repo = PostContentRepository(db_session)
-        post = post_repo.create(topic="Test")
 
         # Act
         content = content_repo.create(
-            post_id=post.id,
+            post_id=seed_post.id,
             platform="instagram",
             content="Visual content",
         )
@@ -330,40 +353,37 @@ class TestPostContentRepository:
         # Assert
         assert content.extra_metadata == {}
 
-    def test_get_by_post_id(self, db_session: Session):
+    def test_get_by_post_id(self, db_session: Session, seed_post: Post):
         """Test getting all content for a post."""
         # Arrange
-        post_repo = PostRepository(db_session)
         content_repo = PostContentRepository(db_session)
-        post = post_repo.create(topic="Test")
+        platforms = ("linkedin", "instagram", "wordpress")
 
-        content_repo.create(post_id=post.id, platform="linkedin", content="LinkedIn post")
-        content_repo.create(post_id=post.id, platform="instagram", content="Instagram post")
-        content_repo.create(post_id=post.id, platform="wordpress", content="WordPress article")
+        _bulk_insert(
+            db_session,
+            PostContent,
+            [{"post_id": seed_post.id, "platform": p, "content": f"{p} post"} for p in platforms],
+        )
 
-        # Act
-        contents = content_repo.get_by_post_id(post.id)
+        # Act (nothing is pending after the insert, so skip autoflush on read)
+        with db_session.no_autoflush:
+            contents = content_repo.get_by_post_id(seed_post.id)
 
         # Assert
         assert len(contents) == 3
-        platforms = [c.platform for c in contents]
-        assert "linkedin" in platforms
-        assert "instagram" in platforms
-        assert "wordpress" in platforms
+        assert {c.platform for c in contents} == set(platforms)
 
-    def test_get_by_post_and_platform(self, db_session: Session):
+    def test_get_by_post_and_platform(self, db_session: Session, seed_post: Post):
         """Test getting content for specific post and platform."""
         # Arrange
-        post_repo = PostRepository(db_session)
         content_repo = PostContentRepository(db_session)
-        post = post_repo.create(topic="Test")
 
-        content_repo.create(post_id=post.id, platform="linkedin", content="LinkedIn post")
-        content_repo.create(post_id=post.id, platform="instagram", content="Instagram post")
+        content_repo.create(post_id=seed_post.id, platform="linkedin", content="LinkedIn post")
+        content_repo.create(post_id=seed_post.id, platform="instagram", content="Instagram post")
 
         # Act
-        linkedin_content = content_repo.get_by_post_and_platform(post.id, "linkedin")
-        wordpress_content = content_repo.get_by_post_and_platform(post.id, "wordpress")
+        linkedin_content = content_repo.get_by_post_and_platform(seed_post.id, "linkedin")
+        wordpress_content = content_repo.get_by_post_and_platform(seed_post.id, "wordpress")
 
         # Assert
         assert linkedin_content is not None
@@ -371,15 +391,13 @@ class TestPostContentRepository:
         assert linkedin_content.content == "LinkedIn post"
         assert wordpress_content is None
 
-    def test_update_content(self, db_session: Session):
+    def test_update_content(self, db_session: Session, seed_post: Post):
         """Test updating existing content."""
         # Arrange
-        post_repo = PostRepository(db_session)
         content_repo = PostContentRepository(db_session)
-        post = post_repo.create(topic="Test")
 
         original_content = content_repo.create(
-            post_id=post.id,
+            post_id=seed_post.id,
             platform="linkedin",
             content="Original content",
             metadata={"version": 1},
@@ -387,7 +405,7 @@ class TestPostContentRepository:
 
         # Act
         updated_content = content_repo.update_content(
-            post_id=post.id,
+            post_id=seed_post.id,
             platform="linkedin",
             content="Updated content",
             metadata={"version": 2},
@@ -399,16 +417,14 @@ class TestPostContentRepository:
         assert updated_content.content == "Updated content"
         assert updated_content.extra_metadata == {"version": 2}
 
-    def test_update_nonexistent_content(self, db_session: Session):
+    def test_update_nonexistent_content(self, db_session: Session, seed_post: Post):
         """Test updating nonexistent content returns None."""
         # Arrange
-        post_repo = PostRepository(db_session)
         content_repo = PostContentRepository(db_session)
-        post = post_repo.create(topic="Test")
 
         # Act
         result = content_repo.update_content(
-            post_id=post.id,
+            post_id=seed_post.id,
             platform="linkedin",
             content="New content",
         )
@@ -416,22 +432,20 @@ class TestPostContentRepository:
         # Assert
         assert result is None
 
-    def test_delete_by_post_id(self, db_session: Session):
+    def test_delete_by_post_id(self, db_session: Session, seed_post: Post):
         """Test deleting all content for a post."""
         # Arrange
-        post_repo = PostRepository(db_session)
         content_repo = PostContentRepository(db_session)
-        post = post_repo.create(topic="Test")
 
-        content_repo.create(post_id=post.id, platform="linkedin", content="LinkedIn")
-        content_repo.create(post_id=post.id, platform="instagram", content="Instagram")
+        content_repo.create(post_id=seed_post.id, platform="linkedin", content="LinkedIn")
+        content_repo.create(post_id=seed_post.id, platform="instagram", content="Instagram")
 
         # Act
-        deleted_count = content_repo.delete_by_post_id(post.id)
+        deleted_count = content_repo.delete_by_post_id(seed_post.id)
 
         # Assert
         assert deleted_count == 2
-        assert content_repo.get_by_post_id(post.id) == []
+        assert content_repo.get_by_post_id(seed_post.id) == []
 
 
 # ===== ReviewRepository Tests =====
@@ -440,53 +454,47 @@ class TestPostContentRepository:
 class TestReviewRepository:
     """Tests for ReviewRepository class."""
 
-    def test_create_review(self, db_session: Session):
+    def test_create_review(self, db_session: Session, seed_post: Post):
         """Test creating a review."""
         # Arrange
-        post_repo = PostRepository(db_session)
         review_repo = ReviewRepository(db_session)
-        post = post_repo.create(topic="Test")
 
         # Act
         review = review_repo.create(
-            post_id=post.id,
+            post_id=seed_post.id,
             action="approve",
             feedback="Looks great!",
         )
 
         # Assert
         assert review.id is not None
-        assert review.post_id == post.id
+        assert review.post_id == seed_post.id
         assert review.action == "approve"
         assert review.feedback == "Looks great!"
         assert review.reviewed_at is not None
 
-    def test_create_review_without_feedback(self, db_session: Session):
+    def test_create_review_without_feedback(self, db_session: Session, seed_post: Post):
         """Test creating a review without feedback."""
         # Arrange
-        post_repo = PostRepository(db_session)
         review_repo = ReviewRepository(db_session)
-        post = post_repo.create(topic="Test")
 
         # Act
-        review = review_repo.create(post_id=post.id, action="approve")
+        review = review_repo.create(post_id=seed_post.id, action="approve")
 
         # Assert
         assert review.feedback is None
 
-    def test_get_by_post_id(self, db_session: Session):
+    def test_get_by_post_id(self, db_session: Session, seed_post: Post):
         """Test getting all reviews for a post."""
         # Arrange
-        post_repo = PostRepository(db_session)
         review_repo = ReviewRepository(db_session)
-        post = post_repo.create(topic="Test")
 
-        review_repo.create(post_id=post.id, action="reject", feedback="Needs work")
-        review_repo.create(post_id=post.id, action="edit", feedback="Minor changes")
-        review_repo.create(post_id=post.id, action="approve", feedback="Perfect!")
+        review_repo.create(post_id=seed_post.id, action="reject", feedback="Needs work")
+        review_repo.create(post_id=seed_post.id, action="edit", feedback="Minor changes")
+        review_repo.create(post_id=seed_post.id, action="approve", feedback="Perfect!")
 
         # Act
-        reviews = review_repo.get_by_post_id(post.id)
+        reviews = review_repo.get_by_post_id(seed_post.id)
 
         # Assert
         assert len(reviews) == 3
@@ -495,34 +503,30 @@ class TestReviewRepository:
         assert reviews[1].action == "edit"
         assert reviews[2].action == "reject"
 
-    def test_get_latest_review(self, db_session: Session):
+    def test_get_latest_review(self, db_session: Session, seed_post: Post):
         """Test getting the most recent review."""
         # Arrange
-        post_repo = PostRepository(db_session)
         review_repo = ReviewRepository(db_session)
-        post = post_repo.create(topic="Test")
 
-        review_repo.create(post_id=post.id, action="reject")
-        review_repo.create(post_id=post.id, action="edit")
-        latest = review_repo.create(post_id=post.id, action="approve")
+        review_repo.create(post_id=seed_post.id, action="reject")
+        review_repo.create(post_id=seed_post.id, action="edit")
+        latest = review_repo.create(post_id=seed_post.id, action="approve")
 
         # Act
-        retrieved_latest = review_repo.get_latest_review(post.id)
+        retrieved_latest = review_repo.get_latest_review(seed_post.id)
 
         # Assert
         assert retrieved_latest is not None
         assert retrieved_latest.id == latest.id
         assert retrieved_latest.action == "approve"
 
-    def test_get_latest_review_no_reviews(self, db_session: Session):
+    def test_get_latest_review_no_reviews(self, db_session: Session, seed_post: Post):
         """Test getting latest review when none exist."""
         # Arrange
-        post_repo = PostRepository(db_session)
         review_repo = ReviewRepository(db_session)
-        post = post_repo.create(topic="Test")
 
         # Act
-        result = review_repo.get_latest_review(post.id)
+        result = review_repo.get_latest_review(seed_post.id)
 
         # Assert
         assert result is None
@@ -541,18 +545,18 @@ class TestReviewRepository:
     def test_get_approval_rate(self, db_session: Session):
         """Test calculating approval rate."""
         # Arrange
-        post_repo = PostRepository(db_session)
         review_repo = ReviewRepository(db_session)
 
-        post1 = post_repo.create(topic="Post 1")
-        post2 = post_repo.create(topic="Post 2")
-        post3 = post_repo.create(topic="Post 3")
-        post4 = post_repo.create(topic="Post 4")
-
-        review_repo.create(post_id=post1.id, action="approve")
-        review_repo.create(post_id=post2.id, action="approve")
-        review_repo.create(post_id=post3.id, action="approve")
-        review_repo.create(post_id=post4.id, action="reject")
+        posts = _bulk_insert(db_session, Post, [{"topic": f"Post {i}"} for i in range(1, 5)])
+        actions = ["approve", "approve", "approve", "reject"]
+        _bulk_insert(
+            db_session,
+            Review,
+            [
+                {"post_id": post.id, "action": action}
+                for post, action in zip(posts, actions, strict=True)
+            ],
+        )
 
         # Act
         rate = review_repo.get_approval_rate()
@@ -567,16 +571,14 @@ class TestReviewRepository:
 class TestEvaluationRepository:
     """Tests for EvaluationRepository class."""
 
-    def test_create_evaluation(self, db_session: Session):
+    def test_create_evaluation(self, db_session: Session, seed_post: Post):
         """Test creating an evaluation."""
         # Arrange
-        post_repo = PostRepository(db_session)
         eval_repo = EvaluationRepository(db_session)
-        post = post_repo.create(topic="Test")
 
         # Act
         evaluation = eval_repo.create(
-            post_id=post.id,
+            post_id=seed_post.id,
             metric_name="readability",
             score=8.5,
             evaluator_type="quality",
@@ -585,30 +587,30 @@ class TestEvaluationRepository:
 
         # Assert
         assert evaluation.id is not None
-        assert evaluation.post_id == post.id
+        assert evaluation.post_id == seed_post.id
         assert evaluation.metric_name == "readability"
         assert evaluation.score == 8.5
         assert evaluation.evaluator_type == "quality"
         assert evaluation.extra_metadata == {"details": "Good structure"}
         assert evaluation.created_at is not None
 
-    def test_get_by_post_id(self, db_session: Session):
+    def test_get_by_post_id(self, db_session: Session, seed_post: Post):
         """Test getting all evaluations for a post."""
         # Arrange
-        post_repo = PostRepository(db_session)
         eval_repo = EvaluationRepository(db_session)
-        post = post_repo.create(topic="Test")
 
         eval_repo.create(
-            post_id=post.id, metric_name="readability", score=8.5, evaluator_type="quality"
+            post_id=seed_post.id, metric_name="readability", score=8.5, evaluator_type="quality"
         )
         eval_repo.create(
-            post_id=post.id, metric_name="engagement", score=7.2, evaluator_type="llm_judge"
+            post_id=seed_post.id, metric_name="engagement", score=7.2, evaluator_type="llm_judge"
+        )
+        eval_repo.create(
+            post_id=seed_post.id, metric_name="seo", score=9.0, evaluator_type="platform"
         )
-        eval_repo.create(post_id=post.id, metric_name="seo", score=9.0, evaluator_type="platform")
 
         # Act
-        evaluations = eval_repo.get_by_post_id(post.id)
+        evaluations = eval_repo.get_by_post_id(seed_post.id)
 
         # Assert
         assert len(evaluations) == 3
@@ -617,23 +619,21 @@ class TestEvaluationRepository:
         assert "engagement" in metrics
         assert "seo" in metrics
 
-    def test_get_by_metric(self, db_session: Session):
+    def test_get_by_metric(self, db_session: Session, seed_post: Post):
         """Test getting evaluation for specific metric."""
         # Arrange
-        post_repo = PostRepository(db_session)
         eval_repo = EvaluationRepository(db_session)
-        post = post_repo.create(topic="Test")
 
         eval_repo.create(
-            post_id=post.id, metric_name="readability", score=8.5, evaluator_type="quality"
+            post_id=seed_post.id, metric_name="readability", score=8.5, evaluator_type="quality"
         )
         eval_repo.create(
-            post_id=post.id, metric_name="engagement", score=7.2, evaluator_type="llm_judge"
+            post_id=seed_post.id, metric_name="engagement", score=7.2, evaluator_type="llm_judge"
         )
 
         # Act
-        readability_eval = eval_repo.get_by_metric(post.id, "readability")
-        seo_eval = eval_repo.get_by_metric(post.id, "seo")
+        readability_eval = eval_repo.get_by_metric(seed_post.id, "readability")
+        seo_eval = eval_repo.get_by_metric(seed_post.id, "seo")
 
         # Assert
         assert readability_eval is not None
@@ -643,24 +643,41 @@ class TestEvaluationRepository:
     def test_get_average_score_by_metric(self, db_session: Session):
         """Test calculating average score for a metric."""
         # Arrange
-        post_repo = PostRepository(db_session)
         eval_repo = EvaluationRepository(db_session)
 
-        post1 = post_repo.create(topic="Post 1")
-        post2 = post_repo.create(topic="Post 2")
-        post3 = post_repo.create(topic="Post 3")
-
-        eval_repo.create(
-            post_id=post1.id, metric_name="readability", score=8.0, evaluator_type="quality"
-        )
-        eval_repo.create(
-            post_id=post2.id, metric_name="readability", score=9.0, evaluator_type="quality"
+        post1, post2, post3 = _bulk_insert(
+            db_session, Post, [{"topic": f"Post {i}"} for i in range(1, 4)]
         )
-        eval_repo.create(
-            post_id=post3.id, metric_name="readability", score=7.0, evaluator_type="quality"
-        )
-        eval_repo.create(
-            post_id=post1.id, metric_name="engagement", score=6.0, evaluator_type="llm_judge"
+
+        _bulk_insert(
+            db_session,
+            Evaluation,
+            [
+                {
+                    "post_id": post1.id,
+                    "metric_name": "readability",
+                    "score": 8.0,
+                    "evaluator_type": "quality",
+                },
+                {
+                    "post_id": post2.id,
+                    "metric_name": "readability",
+                    "score": 9.0,
+                    "evaluator_type": "quality",
+                },
+                {
+                    "post_id": post3.id,
+                    "metric_name": "readability",
+                    "score": 7.0,
+                    "evaluator_type": "quality",
+                },
+                {
+                    "post_id": post1.id,
+                    "metric_name": "engagement",
+                    "score": 6.0,
+                    "evaluator_type": "llm_judge",
+                },
+            ],
         )
 
         # Act
@@ -673,23 +690,21 @@ class TestEvaluationRepository:
         assert avg_engagement == 6.0
         assert avg_nonexistent == 0.0
 
-    def test_delete_by_post_id(self, db_session: Session):
+    def test_delete_by_post_id(self, db_session: Session, seed_post: Post):
         """Test deleting all evaluations for a post."""
         # Arrange
-        post_repo = PostRepository(db_session)
         eval_repo = EvaluationRepository(db_session)
-        post = post_repo.create(topic="Test")
 
         eval_repo.create(
-            post_id=post.id, metric_name="readability", score=8.5, evaluator_type="quality"
+            post_id=seed_post.id, metric_name="readability", score=8.5, evaluator_type="quality"
         )
         eval_repo.create(
-            post_id=post.id, metric_name="engagement", score=7.2, evaluator_type="llm_judge"
+            post_id=seed_post.id, metric_name="engagement", score=7.2, evaluator_type="llm_judge"
         )
 
         # Act
-        deleted_count = eval_repo.delete_by_post_id(post.id)
+        deleted_count = eval_repo.delete_by_post_id(seed_post.id)
 
         # Assert
         assert deleted_count == 2
-        assert eval_repo.get_by_post_id(post.id) == []
+        assert eval_repo.get_by_post_id(seed_post.id) == []
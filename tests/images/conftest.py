@@ -0,0 +1,50 @@
+"""Shared fixtures for image tests."""
+
+import io
+
+import pytest
+from PIL import Image
+
+
+def _build_png(width: int, height: int, level: int) -> bytes:
+    """Encode a solid grayscale image as PNG bytes.
+
+    Grayscale ("L") keeps the encoded sample at one byte per pixel; the
+    tests only round-trip the file and never inspect its colors.
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        level: Gray level (0-255)
+
+    Returns:
+        bytes: PNG image data
+    """
+    img = Image.new("L", (width, height), color=level)
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+# Simple 10x10 mid-gray image, encoded once at import
+_SAMPLE_PNG_BYTES = _build_png(10, 10, 128)
+
+
+@pytest.fixture(scope="session")
+def sample_image_bytes():
+    """Provide the pre-encoded sample test image.
+
+    Returns:
+        bytes: PNG image data
+    """
+    return _SAMPLE_PNG_BYTES
+
+
+@pytest.fixture(scope="session")
+def other_image_bytes():
+    """Provide a second test image that differs from the sample image.
+
+    Returns:
+        bytes: PNG image data
+    """
+    return _build_png(20, 20, 255)
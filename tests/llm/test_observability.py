@@ -1,54 +1,93 @@
 """Tests for Langfuse observability integration."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
-from src.llm.observability import ObservabilityManager
+import pytest
+
+from src.llm.observability import ObservabilityManager, _noop
+
+
+@pytest.fixture
+def langfuse_class(monkeypatch):
+    """Replace the Langfuse client class with a mock.
+
+    Returns:
+        MagicMock: Stand-in for langfuse.Langfuse
+    """
+    langfuse_class = MagicMock()
+    monkeypatch.setattr("langfuse.Langfuse", langfuse_class)
+    return langfuse_class
+
+
+@pytest.fixture
+def mock_langfuse(monkeypatch, langfuse_class):
+    """Configure Langfuse credentials and return the mocked client.
+
+    Returns:
+        MagicMock: Client instance the manager will trace through
+    """
+    monkeypatch.setattr(
+        "src.llm.observability.settings",
+        SimpleNamespace(
+            langfuse_public_key="pk-test",
+            langfuse_secret_key="sk-test",
+            langfuse_host="https://cloud.langfuse.com",
+        ),
+    )
+    return langfuse_class.return_value
+
+
+@pytest.fixture
+def obs(mock_langfuse):
+    """Build an enabled manager and stop its background writer after the test.
+
+    A long flush_interval keeps the writer from draining mid-test; tests call
+    flush() to send traces.
+
+    Yields:
+        ObservabilityManager: Manager tracing through the mocked client
+    """
+    manager = ObservabilityManager(flush_interval=60)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def disabled_settings(monkeypatch):
+    """Configure settings without Langfuse credentials."""
+    monkeypatch.setattr(
+        "src.llm.observability.settings",
+        SimpleNamespace(
+            langfuse_public_key="",
+            langfuse_secret_key="",
+            langfuse_host="https://cloud.langfuse.com",
+        ),
+    )
 
 
 class TestObservabilityManager:
     """Test suite for ObservabilityManager class."""
 
-    @patch("src.llm.observability.settings")
-    @patch("src.llm.observability.Langfuse")
-    def test_initialization_with_credentials(self, mock_langfuse, mock_settings):
+    def test_initialization_with_credentials(self, langfuse_class, mock_langfuse, obs):
         """Test observability manager initializes when credentials available."""
-        mock_settings.langfuse_public_key = "pk-test"
-        mock_settings.langfuse_secret_key = "sk-test"
-        mock_settings.langfuse_host = "https://cloud.langfuse.com"
-
-        obs = ObservabilityManager()
-
         assert obs.enabled is True
-        assert obs.client is not None
-        mock_langfuse.assert_called_once_with(
+        assert obs.client is mock_langfuse
+        langfuse_class.assert_called_once_with(
             public_key="pk-test",
             secret_key="sk-test",
             host="https://cloud.langfuse.com",
         )
 
-    @patch("src.llm.observability.settings")
-    def test_initialization_without_credentials(self, mock_settings):
+    def test_initialization_without_credentials(self, disabled_settings):
         """Test observability manager disables when credentials missing."""
-        mock_settings.langfuse_public_key = ""
-        mock_settings.langfuse_secret_key = ""
-
         obs = ObservabilityManager()
 
         assert obs.enabled is False
         assert obs.client is None
 
-    @patch("src.llm.observability.settings")
-    @patch("src.llm.observability.Langfuse")
-    def test_trace_llm_call_enabled(self, mock_langfuse, mock_settings):
+    def test_trace_llm_call_enabled(self, mock_langfuse, obs):
         """Test trace_llm_call logs when enabled."""
-        mock_settings.langfuse_public_key = "pk-test"
-        mock_settings.langfuse_secret_key = "sk-test"
-        mock_settings.langfuse_host = "https://cloud.langfuse.com"
-
-        mock_client = MagicMock()
-        mock_langfuse.return_value = mock_client
-
-        obs = ObservabilityManager()
         obs.trace_llm_call(
             model="gpt-4",
             prompt="Test prompt",
@@ -57,10 +96,11 @@ class TestObservabilityManager:
             latency_ms=150.5,
             metadata={"post_id": 1, "platform": "linkedin"},
         )
+        obs.flush()
 
         # Verify generation was created
-        mock_client.generation.assert_called_once()
-        call_kwargs = mock_client.generation.call_args[1]
+        mock_langfuse.generation.assert_called_once()
+        call_kwargs = mock_langfuse.generation.call_args[1]
         assert call_kwargs["model"] == "gpt-4"
         assert call_kwargs["input"] == "Test prompt"
         assert call_kwargs["output"] == "Test response"
@@ -68,12 +108,8 @@ class TestObservabilityManager:
         assert "post_id" in call_kwargs["metadata"]
         assert call_kwargs["metadata"]["post_id"] == 1
 
-    @patch("src.llm.observability.settings")
-    def test_trace_llm_call_disabled(self, mock_settings):
+    def test_trace_llm_call_disabled(self, disabled_settings):
         """Test trace_llm_call does nothing when disabled."""
-        mock_settings.langfuse_public_key = ""
-        mock_settings.langfuse_secret_key = ""
-
         obs = ObservabilityManager()
         # Should not raise exception
         obs.trace_llm_call(
@@ -84,20 +120,12 @@ class TestObservabilityManager:
             latency_ms=100,
         )
 
-        # No assertions needed - just verify no exception
+        # Disabled tracing is swapped for a no-op and buffers nothing
+        assert obs.trace_llm_call is _noop
+        assert not any(obs._buffers)
 
-    @patch("src.llm.observability.settings")
-    @patch("src.llm.observability.Langfuse")
-    def test_trace_agent_execution_enabled(self, mock_langfuse, mock_settings):
+    def test_trace_agent_execution_enabled(self, mock_langfuse, obs):
         """Test trace_agent_execution logs when enabled."""
-        mock_settings.langfuse_public_key = "pk-test"
-        mock_settings.langfuse_secret_key = "sk-test"
-        mock_settings.langfuse_host = "https://cloud.langfuse.com"
-
-        mock_client = MagicMock()
-        mock_langfuse.return_value = mock_client
-
-        obs = ObservabilityManager()
         obs.trace_agent_execution(
             post_id=1,
             topic="AI trends",
@@ -105,22 +133,21 @@ class TestObservabilityManager:
             duration_ms=5000.0,
             metadata={"total_tokens": 500},
         )
+        obs.flush()
 
         # Verify trace was created
-        mock_client.trace.assert_called_once()
-        call_kwargs = mock_client.trace.call_args[1]
+        mock_langfuse.trace.assert_called_once()
+        call_kwargs = mock_langfuse.trace.call_args[1]
         assert call_kwargs["name"] == "agent_execution"
         assert call_kwargs["metadata"]["post_id"] == 1
         assert call_kwargs["metadata"]["topic"] == "AI trends"
         assert call_kwargs["metadata"]["status"] == "approved"
         assert call_kwargs["metadata"]["duration_ms"] == 5000.0
+        assert call_kwargs["metadata"]["total_tokens"] == 500
+        assert type(call_kwargs["metadata"]) is dict
 
-    @patch("src.llm.observability.settings")
-    def test_trace_agent_execution_disabled(self, mock_settings):
+    def test_trace_agent_execution_disabled(self, disabled_settings):
         """Test trace_agent_execution does nothing when disabled."""
-        mock_settings.langfuse_public_key = ""
-        mock_settings.langfuse_secret_key = ""
-
         obs = ObservabilityManager()
         # Should not raise exception
         obs.trace_agent_execution(
@@ -130,37 +157,28 @@ class TestObservabilityManager:
             duration_ms=1000.0,
         )
 
-    @patch("src.llm.observability.settings")
-    @patch("src.llm.observability.Langfuse")
-    def test_trace_custom_event_enabled(self, mock_langfuse, mock_settings):
-        """Test trace_custom_event logs when enabled."""
-        mock_settings.langfuse_public_key = "pk-test"
-        mock_settings.langfuse_secret_key = "sk-test"
-        mock_settings.langfuse_host = "https://cloud.langfuse.com"
-
-        mock_client = MagicMock()
-        mock_langfuse.return_value = mock_client
+        assert obs.trace_agent_execution is _noop
+        assert not any(obs._buffers)
 
-        obs = ObservabilityManager()
+    def test_trace_custom_event_enabled(self, mock_langfuse, obs):
+        """Test trace_custom_event logs when enabled."""
         obs.trace_custom_event(
             event_name="image_generation",
             post_id=1,
             data={"model": "dall-e-3", "size": "1024x1024"},
         )
+        obs.flush()
 
         # Verify event was created
-        mock_client.event.assert_called_once()
-        call_kwargs = mock_client.event.call_args[1]
+        mock_langfuse.event.assert_called_once()
+        call_kwargs = mock_langfuse.event.call_args[1]
         assert call_kwargs["name"] == "image_generation"
         assert call_kwargs["metadata"]["post_id"] == 1
         assert call_kwargs["metadata"]["model"] == "dall-e-3"
+        assert type(call_kwargs["metadata"]) is dict
 
-    @patch("src.llm.observability.settings")
-    def test_trace_custom_event_disabled(self, mock_settings):
+    def test_trace_custom_event_disabled(self, disabled_settings):
         """Test trace_custom_event does nothing when disabled."""
-        mock_settings.langfuse_public_key = ""
-        mock_settings.langfuse_secret_key = ""
-
         obs = ObservabilityManager()
         # Should not raise exception
         obs.trace_custom_event(
@@ -169,44 +187,25 @@ class TestObservabilityManager:
             data={"key": "value"},
         )
 
-    @patch("src.llm.observability.settings")
-    @patch("src.llm.observability.Langfuse")
-    def test_flush_enabled(self, mock_langfuse, mock_settings):
-        """Test flush calls Langfuse flush when enabled."""
-        mock_settings.langfuse_public_key = "pk-test"
-        mock_settings.langfuse_secret_key = "sk-test"
-        mock_settings.langfuse_host = "https://cloud.langfuse.com"
-
-        mock_client = MagicMock()
-        mock_langfuse.return_value = mock_client
+        assert obs.trace_custom_event is _noop
+        assert not any(obs._buffers)
 
-        obs = ObservabilityManager()
+    def test_flush_enabled(self, mock_langfuse, obs):
+        """Test flush calls Langfuse flush when enabled."""
         obs.flush()
 
-        mock_client.flush.assert_called_once()
+        mock_langfuse.flush.assert_called_once()
 
-    @patch("src.llm.observability.settings")
-    def test_flush_disabled(self, mock_settings):
+    def test_flush_disabled(self, disabled_settings):
         """Test flush does nothing when disabled."""
-        mock_settings.langfuse_public_key = ""
-        mock_settings.langfuse_secret_key = ""
-
         obs = ObservabilityManager()
         # Should not raise exception
         obs.flush()
 
-    @patch("src.llm.observability.settings")
-    @patch("src.llm.observability.Langfuse")
-    def test_trace_llm_call_without_metadata(self, mock_langfuse, mock_settings):
-        """Test trace_llm_call works without metadata."""
-        mock_settings.langfuse_public_key = "pk-test"
-        mock_settings.langfuse_secret_key = "sk-test"
-        mock_settings.langfuse_host = "https://cloud.langfuse.com"
-
-        mock_client = MagicMock()
-        mock_langfuse.return_value = mock_client
+        assert obs.flush is _noop
 
-        obs = ObservabilityManager()
+    def test_trace_llm_call_without_metadata(self, mock_langfuse, obs):
+        """Test trace_llm_call works without metadata."""
         obs.trace_llm_call(
             model="gpt-4",
             prompt="Test",
@@ -215,23 +214,15 @@ class TestObservabilityManager:
             latency_ms=100,
             metadata=None,
         )
+        obs.flush()
 
-        mock_client.generation.assert_called_once()
-        call_kwargs = mock_client.generation.call_args[1]
+        mock_langfuse.generation.assert_called_once()
+        call_kwargs = mock_langfuse.generation.call_args[1]
         assert call_kwargs["metadata"] == {}
+        assert type(call_kwargs["metadata"]) is dict
 
-    @patch("src.llm.observability.settings")
-    @patch("src.llm.observability.Langfuse")
-    def test_trace_agent_execution_without_metadata(self, mock_langfuse, mock_settings):
+    def test_trace_agent_execution_without_metadata(self, mock_langfuse, obs):
         """Test trace_agent_execution works without metadata."""
-        mock_settings.langfuse_public_key = "pk-test"
-        mock_settings.langfuse_secret_key = "sk-test"
-        mock_settings.langfuse_host = "https://cloud.langfuse.com"
-
-        mock_client = MagicMock()
-        mock_langfuse.return_value = mock_client
-
-        obs = ObservabilityManager()
         obs.trace_agent_execution(
             post_id=1,
             topic="Test",
@@ -239,9 +230,58 @@ class TestObservabilityManager:
             duration_ms=1000,
             metadata=None,
         )
+        obs.flush()
 
-        mock_client.trace.assert_called_once()
-        call_kwargs = mock_client.trace.call_args[1]
+        mock_langfuse.trace.assert_called_once()
+        call_kwargs = mock_langfuse.trace.call_args[1]
         # Should still have basic metadata
         assert "post_id" in call_kwargs["metadata"]
         assert "topic" in call_kwargs["metadata"]
+
+    def test_caller_metadata_changes_after_trace_do_not_leak(self, mock_langfuse, obs):
+        """Test metadata is copied when the trace is queued, not when it is sent."""
+        metadata = {"platform": "linkedin"}
+        data = {"image": "hero.png"}
+        obs.trace_llm_call("m", "p", "r", 1, 1.0, metadata=metadata)
+        obs.trace_agent_execution(1, "Test", "approved", 1000, metadata=metadata)
+        obs.trace_custom_event("image_generated", 1, data)
+
+        metadata["platform"] = "twitter"
+        metadata["late_key"] = True
+        data.clear()
+        obs.flush()
+
+        expected = {"platform": "linkedin"}
+        assert mock_langfuse.generation.call_args[1]["metadata"] == expected
+        assert mock_langfuse.trace.call_args[1]["metadata"]["platform"] == "linkedin"
+        assert "late_key" not in mock_langfuse.trace.call_args[1]["metadata"]
+        assert mock_langfuse.event.call_args[1]["metadata"] == {"post_id": 1, "image": "hero.png"}
+
+    def test_traces_are_buffered_until_flush(self, mock_langfuse, obs):
+        """Test traces are queued off the caller's thread and sent on flush."""
+        obs.trace_llm_call(
+            model="gpt-4", prompt="Test", response="Response", tokens=10, latency_ms=100
+        )
+        obs.trace_custom_event(event_name="image_generation", post_id=1, data={})
+
+        # Nothing is sent until the buffer is drained
+        mock_langfuse.generation.assert_not_called()
+        mock_langfuse.event.assert_not_called()
+        assert sum(len(buffer) for buffer in obs._buffers) == 2
+
+        obs.flush()
+
+        mock_langfuse.generation.assert_called_once()
+        mock_langfuse.event.assert_called_once()
+        assert sum(len(buffer) for buffer in obs._buffers) == 0
+
+    def test_close_stops_writer_and_sends_pending_traces(self, mock_langfuse, obs):
+        """Test close drains remaining traces and stops the background writer."""
+        writer = obs._writer
+        obs.trace_agent_execution(post_id=1, topic="Test", status="approved", duration_ms=1000)
+
+        obs.close()
+
+        assert not writer.is_alive()
+        mock_langfuse.trace.assert_called_once()
+        mock_langfuse.flush.assert_called_once()
@@ -1,11 +1,119 @@
 """Tests for LLM router with fallback chain."""
 
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, patch
 
+import httpx
+import openai
 import pytest
 from langchain_core.messages import AIMessage
+from pydantic import BaseModel
 
-from src.llm.router import LLMRouter
+from src.llm.router import (
+    LLMRouter,
+    _build_client,
+    _cooldowns,
+    _shared_http_client,
+    _system_prefix,
+    close_http_client,
+)
+
+
+def _api_status_error(error_class: type[openai.APIStatusError], status_code: int):
+    """Build an OpenAI SDK status error as raised for an OpenRouter response.
+
+    Args:
+        error_class: openai exception class to instantiate
+        status_code: HTTP status of the failed response
+
+    Returns:
+        openai.APIStatusError: Exception carrying the status code
+    """
+    request = httpx.Request("POST", "https://openrouter.ai/api/v1/chat/completions")
+    response = httpx.Response(status_code, request=request)
+    return error_class(f"HTTP {status_code}", response=response, body=None)
+
+
+class StubChat:
+    """Lightweight stand-in for ChatOpenAI that replays scripted responses.
+
+    Each call to ``invoke``, ``ainvoke`` or ``stream`` pops the next entry from
+    the class-level ``responses`` list: exceptions are raised, anything else is
+    returned (or iterated, for ``stream``).
+    """
+
+    responses: list = []
+    instances: list["StubChat"] = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.calls: list[list[dict]] = []
+        StubChat.instances.append(self)
+
+    def _next(self, messages):
+        self.calls.append(messages)
+        item = StubChat.responses.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def invoke(self, messages):
+        return self._next(messages)
+
+    async def ainvoke(self, messages):
+        return self._next(messages)
+
+    def stream(self, messages):
+        yield from self._next(messages)
+
+
+@pytest.fixture
+def stub_chat(monkeypatch):
+    """Replace the ChatOpenAI client class with StubChat.
+
+    Returns:
+        type[StubChat]: Stub class with fresh ``responses`` and ``instances``
+    """
+    monkeypatch.setattr(StubChat, "responses", [])
+    monkeypatch.setattr(StubChat, "instances", [])
+    monkeypatch.setattr("langchain_openai.ChatOpenAI", StubChat)
+    return StubChat
+
+
+@pytest.fixture
+def recorded_sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping, with jitter pinned to zero.
+
+    Returns:
+        list[float]: Delays passed to time.sleep or asyncio.sleep, in order
+    """
+    sleeps: list[float] = []
+
+    async def fake_async_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("src.llm.router.time.sleep", sleeps.append)
+    monkeypatch.setattr("src.llm.router.asyncio.sleep", fake_async_sleep)
+    monkeypatch.setattr("src.llm.router.random.random", lambda: 0.0)
+    return sleeps
+
+
+@pytest.fixture(autouse=True)
+def clear_cooldowns():
+    """Reset the process-wide model cooldowns so failures don't leak between tests."""
+    _cooldowns.clear()
+    yield
+    _cooldowns.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Drop memoized ChatOpenAI clients so each test sees its own patches."""
+    _build_client.cache_clear()
+    yield
+    _build_client.cache_clear()
 
 
 class TestLLMRouter:
@@ -88,8 +196,264 @@ class TestLLMRouter:
             router.generate("Test prompt")
 
         assert "All models in fallback chain failed" in str(exc_info.value)
+        # The last model's error is reported and chained
+        assert "GPT-3.5 failed" in str(exc_info.value)
+        assert str(exc_info.value.__cause__) == "GPT-3.5 failed"
         assert mock_call_model_retry.call_count == 3
 
+    @patch("src.llm.router.time.monotonic")
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_failed_model_skipped_during_cooldown(self, mock_call_model_retry, mock_monotonic):
+        """Test a model that exhausted its retries is skipped until its cooldown ends."""
+        mock_monotonic.return_value = 1000.0
+        mock_call_model_retry.side_effect = [
+            Exception("Primary model failed"),
+            "First response from GPT-4o",
+            "Second response from GPT-4o",
+        ]
+
+        router = LLMRouter(cooldown_seconds=30)
+        router.generate("First prompt")
+
+        # Within the cooldown window the primary is not called at all
+        mock_monotonic.return_value = 1029.0
+        result = router.generate("Second prompt")
+
+        assert result == "Second response from GPT-4o"
+        called_models = [c[0][0] for c in mock_call_model_retry.call_args_list]
+        assert called_models == [
+            "anthropic/claude-3.5-sonnet",
+            "openai/gpt-4o",
+            "openai/gpt-4o",
+        ]
+
+    @patch("src.llm.router.time.monotonic")
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_failed_model_retried_after_cooldown(self, mock_call_model_retry, mock_monotonic):
+        """Test a model is tried again once its cooldown has expired."""
+        mock_monotonic.return_value = 1000.0
+        mock_call_model_retry.side_effect = [
+            Exception("Primary model failed"),
+            "Response from GPT-4o",
+            "Response from Claude",
+        ]
+
+        router = LLMRouter(cooldown_seconds=30)
+        router.generate("First prompt")
+
+        mock_monotonic.return_value = 1031.0
+        result = router.generate("Second prompt")
+
+        assert result == "Response from Claude"
+        assert mock_call_model_retry.call_args[0][0] == "anthropic/claude-3.5-sonnet"
+
+    @patch("src.llm.router.time.monotonic")
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_all_models_cooling_down_probes_soonest(self, mock_call_model_retry, mock_monotonic):
+        """Test the model whose cooldown ends first is still tried when all are cooling down."""
+        mock_monotonic.return_value = 1000.0
+        mock_call_model_retry.side_effect = [
+            ConnectionError("Claude unreachable"),
+            ConnectionError("GPT-4o unreachable"),
+            ConnectionError("GPT-3.5 unreachable"),
+            "Recovered response",
+            "Next response",
+        ]
+
+        router = LLMRouter(cooldown_seconds=30)
+        with pytest.raises(RuntimeError):
+            router.generate("First prompt")
+
+        mock_monotonic.return_value = 1001.0
+        assert router.generate("Second prompt") == "Recovered response"
+        # A successful probe ends that model's cooldown
+        assert router.generate("Third prompt") == "Next response"
+
+        called_models = [c[0][0] for c in mock_call_model_retry.call_args_list]
+        assert called_models[3:] == ["anthropic/claude-3.5-sonnet"] * 2
+
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_cooldown_cleared_concurrently_does_not_raise_key_error(
+        self, mock_call_model_retry, monkeypatch
+    ):
+        """Test a cooldown ended by another thread mid-check doesn't escape as KeyError."""
+
+        class ClearedAfterRead(dict):
+            """Cooldowns that a concurrent successful probe clears right after each read."""
+
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                self.pop(key, None)
+                return value
+
+        mock_call_model_retry.return_value = "Response"
+        router = LLMRouter(cooldown_seconds=30)
+        deadline = time.monotonic() + 30
+        monkeypatch.setattr(
+            "src.llm.router._cooldowns", ClearedAfterRead.fromkeys(router.model_chain, deadline)
+        )
+
+        assert router.generate("Test prompt") == "Response"
+        assert mock_call_model_retry.call_args[0][0] == "anthropic/claude-3.5-sonnet"
+
+    @patch("src.llm.router.time.monotonic")
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_cooldown_shared_across_router_instances(self, mock_call_model_retry, mock_monotonic):
+        """Test a fresh router skips a model another router just saw failing."""
+        mock_monotonic.return_value = 1000.0
+        mock_call_model_retry.side_effect = [
+            ConnectionError("Claude unreachable"),
+            "First response from GPT-4o",
+            "Second response from GPT-4o",
+        ]
+
+        LLMRouter(cooldown_seconds=30).generate("First prompt")
+        result = LLMRouter(cooldown_seconds=30).generate("Second prompt")
+
+        assert result == "Second response from GPT-4o"
+        called_models = [c[0][0] for c in mock_call_model_retry.call_args_list]
+        assert called_models == ["anthropic/claude-3.5-sonnet", "openai/gpt-4o", "openai/gpt-4o"]
+
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_prompt_specific_error_does_not_start_cooldown(self, mock_call_model_retry):
+        """Test a non-retryable client error does not take the model out of rotation."""
+        mock_call_model_retry.side_effect = [
+            _api_status_error(openai.BadRequestError, 400),
+            "Response from GPT-4o",
+            "Response from Claude",
+        ]
+
+        router = LLMRouter()
+        router.generate("Prompt that is too long")
+        result = router.generate("Normal prompt")
+
+        assert result == "Response from Claude"
+        assert mock_call_model_retry.call_args[0][0] == "anthropic/claude-3.5-sonnet"
+
+    @patch("src.llm.router.LLMRouter._call_model_structured_with_retry")
+    def test_structured_validation_error_does_not_start_cooldown(self, mock_call_structured):
+        """Test output validation failures in generate_structured don't cool the model down."""
+        mock_call_structured.side_effect = [ValueError("Invalid output"), "parsed", "parsed"]
+
+        router = LLMRouter()
+        router.generate_structured("First prompt", response_model=BaseModel)
+        router.generate_structured("Second prompt", response_model=BaseModel)
+
+        called_models = [c[0][0] for c in mock_call_structured.call_args_list]
+        assert called_models == [
+            "anthropic/claude-3.5-sonnet",
+            "openai/gpt-4o",
+            "anthropic/claude-3.5-sonnet",
+        ]
+
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_generate_batch_preserves_order(self, mock_call_model_retry):
+        """Test generate_batch returns one response per prompt, in prompt order."""
+        mock_call_model_retry.side_effect = lambda *args: f"resp-{args[1]}"
+        prompts = [f"prompt-{i}" for i in range(10)]
+
+        router = LLMRouter()
+        results = router.generate_batch(prompts, system_prompt="System context", max_workers=4)
+
+        assert results == [f"resp-prompt-{i}" for i in range(10)]
+        assert mock_call_model_retry.call_count == len(prompts)
+        assert all(c[0][2] == "System context" for c in mock_call_model_retry.call_args_list)
+
+    def test_generate_batch_empty(self):
+        """Test generate_batch with no prompts returns an empty list."""
+        router = LLMRouter()
+
+        assert router.generate_batch([]) == []
+
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_cache_hit(self, mock_call_model_retry):
+        """Test identical temperature-0 prompts within the TTL are served from the cache."""
+        mock_call_model_retry.side_effect = ["First response", "Second response"]
+
+        router = LLMRouter(response_cache_size=8)
+        first = router.generate("same", system_prompt="System context", temperature=0.0)
+        second = router.generate("same", system_prompt="System context", temperature=0.0)
+
+        assert first == second == "First response"
+        mock_call_model_retry.assert_called_once()
+
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_cache_hit_with_zero_temperature_router(self, mock_call_model_retry):
+        """Test a router built with temperature=0.0 keeps it and caches responses."""
+        mock_call_model_retry.side_effect = ["First response", "Second response"]
+
+        router = LLMRouter(temperature=0.0, response_cache_size=8)
+        first = router.generate("same")
+        second = router.generate("same")
+
+        assert router.temperature == 0.0
+        assert first == second == "First response"
+        mock_call_model_retry.assert_called_once()
+
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_cache_skips_sampled_output(self, mock_call_model_retry):
+        """Test responses sampled at a non-zero temperature are never cached."""
+        mock_call_model_retry.side_effect = ["First response", "Second response"]
+
+        router = LLMRouter(response_cache_size=8)
+        router.generate("same")
+        result = router.generate("same")
+
+        assert result == "Second response"
+        assert mock_call_model_retry.call_count == 2
+
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_cache_distinguishes_generation_parameters(self, mock_call_model_retry):
+        """Test a different system prompt or max tokens is not a cache hit."""
+        mock_call_model_retry.return_value = "Response"
+
+        router = LLMRouter(response_cache_size=8)
+        router.generate("same", temperature=0.0)
+        router.generate("same", system_prompt="System context", temperature=0.0)
+        router.generate("same", temperature=0.0, max_tokens=100)
+
+        assert mock_call_model_retry.call_count == 3
+
+    @patch("src.llm.router.time.monotonic")
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_cache_entry_expires_after_ttl(self, mock_call_model_retry, mock_monotonic):
+        """Test cached responses are regenerated once the TTL has passed."""
+        mock_monotonic.return_value = 1000.0
+        mock_call_model_retry.side_effect = ["First response", "Second response"]
+
+        router = LLMRouter(response_cache_size=8, response_cache_ttl=300)
+        router.generate("same", temperature=0.0)
+
+        mock_monotonic.return_value = 1301.0
+        result = router.generate("same", temperature=0.0)
+
+        assert result == "Second response"
+        assert mock_call_model_retry.call_count == 2
+
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_cache_evicts_least_recently_used(self, mock_call_model_retry):
+        """Test the cache holds at most response_cache_size entries."""
+        mock_call_model_retry.side_effect = lambda *args: f"resp-{args[1]}"
+
+        router = LLMRouter(response_cache_size=2)
+        for prompt in ["a", "b", "a", "c", "a", "b"]:
+            # "a" hits and makes "b" least recently used; "c" evicts "b"
+            router.generate(prompt, temperature=0.0)
+
+        called_prompts = [c[0][1] for c in mock_call_model_retry.call_args_list]
+        assert called_prompts == ["a", "b", "c", "b"]
+
+    @patch("src.llm.router.LLMRouter._call_model_with_retry")
+    def test_cache_disabled_by_default(self, mock_call_model_retry):
+        """Test the response cache is opt-in: by default the model is always called."""
+        mock_call_model_retry.return_value = "Response"
+
+        router = LLMRouter()
+        router.generate("same", temperature=0.0)
+        router.generate("same", temperature=0.0)
+
+        assert mock_call_model_retry.call_count == 2
+
     @patch("src.llm.router.LLMRouter._call_model_with_retry")
     def test_system_prompt_passed(self, mock_call_model_retry):
         """Test system prompt is passed to model call."""
@@ -123,14 +487,9 @@ class TestLLMRouter:
         call_args = mock_call_model_retry.call_args
         assert call_args[0][4] == 500
 
-    @patch("src.llm.router.ChatOpenAI")
-    def test_call_model_success(self, mock_chat_openai):
+    def test_call_model_success(self, stub_chat):
         """Test _call_model makes correct API call."""
-        # Mock the ChatOpenAI instance and its invoke method
-        mock_client = MagicMock()
-        mock_response = AIMessage(content="Generated text")
-        mock_client.invoke.return_value = mock_response
-        mock_chat_openai.return_value = mock_client
+        stub_chat.responses = [AIMessage(content="Generated text")]
 
         router = LLMRouter()
         result = router._call_model(
@@ -142,24 +501,18 @@ class TestLLMRouter:
         )
 
         assert result == "Generated text"
-        # Verify client was created with correct parameters
-        mock_chat_openai.assert_called_once()
-        # Verify invoke was called with messages
-        mock_client.invoke.assert_called_once()
-        messages = mock_client.invoke.call_args[0][0]
+        # Verify a single client was created and invoked with messages
+        (client,) = stub_chat.instances
+        (messages,) = client.calls
         assert len(messages) == 2
         assert messages[0]["role"] == "system"
         assert messages[0]["content"] == "System context"
         assert messages[1]["role"] == "user"
         assert messages[1]["content"] == "Test prompt"
 
-    @patch("src.llm.router.ChatOpenAI")
-    def test_call_model_without_system_prompt(self, mock_chat_openai):
+    def test_call_model_without_system_prompt(self, stub_chat):
         """Test _call_model works without system prompt."""
-        mock_client = MagicMock()
-        mock_response = AIMessage(content="Generated text")
-        mock_client.invoke.return_value = mock_response
-        mock_chat_openai.return_value = mock_client
+        stub_chat.responses = [AIMessage(content="Generated text")]
 
         router = LLMRouter()
         result = router._call_model(
@@ -171,23 +524,88 @@ class TestLLMRouter:
         )
 
         assert result == "Generated text"
-        messages = mock_client.invoke.call_args[0][0]
+        messages = stub_chat.instances[0].calls[0]
         assert len(messages) == 1
         assert messages[0]["role"] == "user"
         assert messages[0]["content"] == "Test prompt"
 
-    @patch("src.llm.router.ChatOpenAI")
-    @patch("src.llm.router.time.sleep")
-    def test_retry_logic_with_exponential_backoff(self, mock_sleep, mock_chat_openai):
-        """Test retry logic with exponential backoff."""
-        mock_client = MagicMock()
+    def test_system_prefix_is_cached_per_prompt(self):
+        """Test the system message prefix is built once per system prompt."""
+        prefix = _system_prefix("System context")
+
+        assert prefix == ({"role": "system", "content": "System context"},)
+        assert _system_prefix("System context") is prefix
+        assert _system_prefix(None) == ()
+        assert _system_prefix("") == ()
+
+    def test_stream_generate_yields_chunks(self, stub_chat):
+        """Test stream_generate yields content chunks as the model produces them."""
+        stub_chat.responses = [
+            [AIMessage(content="a"), AIMessage(content=""), AIMessage(content="b")]
+        ]
+
+        router = LLMRouter()
+        result = "".join(router.stream_generate("p", system_prompt="System context"))
+
+        assert result == "ab"
+        messages = stub_chat.instances[0].calls[0]
+        assert messages[0] == {"role": "system", "content": "System context"}
+        assert messages[1] == {"role": "user", "content": "p"}
+
+    def test_stream_generate_falls_back_before_first_chunk(self, stub_chat):
+        """Test stream_generate moves to the next model if the stream fails to start."""
+        stub_chat.responses = [
+            Exception("Primary model failed"),
+            [AIMessage(content="fallback")],
+        ]
+
+        router = LLMRouter()
+        result = list(router.stream_generate("p"))
+
+        assert result == ["fallback"]
+        assert [c.kwargs["model"] for c in stub_chat.instances] == [
+            "anthropic/claude-3.5-sonnet",
+            "openai/gpt-4o",
+        ]
+
+    def test_stream_generate_all_models_fail(self, stub_chat):
+        """Test stream_generate raises the shared chained error when no model starts."""
+        stub_chat.responses = [Exception(f"Model {i} failed") for i in range(3)]
+
+        router = LLMRouter()
+
+        with pytest.raises(RuntimeError, match="All models in fallback chain failed") as exc:
+            list(router.stream_generate("p"))
+
+        assert str(exc.value.__cause__) == "Model 2 failed"
+
+    def test_stream_generate_raises_mid_stream_failure(self, stub_chat):
+        """Test a failure after output has been yielded is raised, not restarted."""
+
+        def broken_stream():
+            yield AIMessage(content="partial")
+            raise Exception("Connection dropped")
+
+        stub_chat.responses = [broken_stream()]
+
+        router = LLMRouter()
+        chunks = []
+
+        with pytest.raises(Exception, match="Connection dropped"):
+            for chunk in router.stream_generate("p"):
+                chunks.append(chunk)
+
+        assert chunks == ["partial"]
+        assert len(stub_chat.instances) == 1
+
+    def test_retry_logic_with_exponential_backoff(self, stub_chat, recorded_sleeps):
+        """Test retry logic with exponential backoff (jitter pinned to zero)."""
         # Fail twice, succeed on third attempt
-        mock_client.invoke.side_effect = [
+        stub_chat.responses = [
             Exception("API error 1"),
             Exception("API error 2"),
             AIMessage(content="Success on retry"),
         ]
-        mock_chat_openai.return_value = mock_client
 
         router = LLMRouter()
         result = router._call_model_with_retry(
@@ -199,19 +617,23 @@ class TestLLMRouter:
         )
 
         assert result == "Success on retry"
-        # Verify exponential backoff sleep times
-        assert mock_sleep.call_count == 2
-        assert mock_sleep.call_args_list[0][0][0] == 1  # 2^0 = 1
-        assert mock_sleep.call_args_list[1][0][0] == 2  # 2^1 = 2
-
-    @patch("src.llm.router.ChatOpenAI")
-    @patch("src.llm.router.time.sleep")
-    def test_retry_exhaustion(self, mock_sleep, mock_chat_openai):
+        # Verify exponential backoff sleep times: 2^0, 2^1
+        assert recorded_sleeps == [1, 2]
+
+    def test_backoff_delay_is_capped_with_jitter(self):
+        """Test backoff stops doubling at the cap and adds at most retry_jitter."""
+        router = LLMRouter(retry_cap_seconds=8.0, retry_jitter=0.5)
+
+        with patch("src.llm.router.random.random", return_value=0.0):
+            assert [router._backoff_delay(i) for i in range(5)] == [1, 2, 4, 8, 8]
+
+        for _ in range(100):
+            assert 8.0 <= router._backoff_delay(10) <= 8.5
+
+    def test_retry_exhaustion(self, stub_chat, recorded_sleeps):
         """Test exception raised when retries exhausted."""
-        mock_client = MagicMock()
         # Fail all attempts
-        mock_client.invoke.side_effect = Exception("Persistent API error")
-        mock_chat_openai.return_value = mock_client
+        stub_chat.responses = [Exception("Persistent API error") for _ in range(3)]
 
         router = LLMRouter()
 
@@ -226,9 +648,111 @@ class TestLLMRouter:
 
         assert "Persistent API error" in str(exc_info.value)
         # Max retries is 3, so should try 3 times total
-        assert mock_client.invoke.call_count == 3
+        assert len(stub_chat.instances[0].calls) == 3
         # Should sleep 2 times (between attempts 1-2 and 2-3)
-        assert mock_sleep.call_count == 2
+        assert len(recorded_sleeps) == 2
+
+    @patch("src.llm.router.LLMRouter._acall_model_with_retry", new_callable=AsyncMock)
+    async def test_agenerate_fallback_on_primary_failure(self, mock_acall_model_retry):
+        """Test agenerate falls back to the next model when the primary fails."""
+        mock_acall_model_retry.side_effect = [
+            Exception("Primary model failed"),
+            "Response from GPT-4o",
+        ]
+
+        router = LLMRouter()
+        result = await router.agenerate("Test prompt", system_prompt="System context")
+
+        assert result == "Response from GPT-4o"
+        assert mock_acall_model_retry.await_count == 2
+        assert mock_acall_model_retry.call_args_list[0][0][0] == "anthropic/claude-3.5-sonnet"
+        assert mock_acall_model_retry.call_args_list[1][0][0] == "openai/gpt-4o"
+        assert mock_acall_model_retry.call_args[0][2] == "System context"
+
+    @patch("src.llm.router.LLMRouter._acall_model_with_retry", new_callable=AsyncMock)
+    async def test_agenerate_all_models_fail(self, mock_acall_model_retry):
+        """Test agenerate raises when every model in the chain fails."""
+        mock_acall_model_retry.side_effect = Exception("Model failed")
+
+        router = LLMRouter()
+
+        with pytest.raises(RuntimeError, match="All models in fallback chain failed") as exc:
+            await router.agenerate("Test prompt")
+
+        assert str(exc.value.__cause__) == "Model failed"
+        assert mock_acall_model_retry.await_count == 3
+
+    @patch("src.llm.router.LLMRouter._call_model_structured_with_retry")
+    def test_generate_structured_all_models_fail(self, mock_call_structured):
+        """Test generate_structured raises the shared chained error when every model fails."""
+        mock_call_structured.side_effect = Exception("Model failed")
+
+        router = LLMRouter()
+
+        with pytest.raises(RuntimeError, match="All models in fallback chain failed") as exc:
+            router.generate_structured("Test prompt", response_model=BaseModel)
+
+        assert str(exc.value.__cause__) == "Model failed"
+        assert mock_call_structured.call_count == 3
+
+    async def test_async_retry_logic_with_exponential_backoff(self, stub_chat, recorded_sleeps):
+        """Test async retry awaits exponential backoff instead of blocking."""
+        # Fail twice, succeed on third attempt
+        stub_chat.responses = [
+            Exception("API error 1"),
+            Exception("API error 2"),
+            AIMessage(content="Success on retry"),
+        ]
+
+        router = LLMRouter()
+        result = await router._acall_model_with_retry(
+            model="anthropic/claude-3.5-sonnet",
+            prompt="Test prompt",
+            system_prompt=None,
+            temperature=0.7,
+            max_tokens=2000,
+        )
+
+        assert result == "Success on retry"
+        assert len(stub_chat.instances[0].calls) == 3
+        assert recorded_sleeps == [1, 2]
+
+    def test_non_retryable_skips_sleep(self, stub_chat, recorded_sleeps):
+        """Test auth errors fail immediately instead of burning retries."""
+        stub_chat.responses = [_api_status_error(openai.AuthenticationError, 401)]
+
+        router = LLMRouter()
+
+        with pytest.raises(openai.AuthenticationError):
+            router._call_model_with_retry(
+                model="anthropic/claude-3.5-sonnet",
+                prompt="Test prompt",
+                system_prompt=None,
+                temperature=0.7,
+                max_tokens=2000,
+            )
+
+        assert len(stub_chat.instances[0].calls) == 1
+        assert recorded_sleeps == []
+
+    def test_server_errors_are_retried(self, stub_chat, recorded_sleeps):
+        """Test 5xx responses are still retried with backoff."""
+        stub_chat.responses = [
+            _api_status_error(openai.InternalServerError, 502),
+            AIMessage(content="Success on retry"),
+        ]
+
+        router = LLMRouter()
+        result = router._call_model_with_retry(
+            model="anthropic/claude-3.5-sonnet",
+            prompt="Test prompt",
+            system_prompt=None,
+            temperature=0.7,
+            max_tokens=2000,
+        )
+
+        assert result == "Success on retry"
+        assert recorded_sleeps == [1]
 
     def test_create_client(self):
         """Test _create_client creates properly configured client."""
@@ -239,3 +763,66 @@ class TestLLMRouter:
         assert client.openai_api_base == "https://openrouter.ai/api/v1"
         assert client.temperature == 0.7
         assert client.max_tokens == 2000
+        assert client.http_client is _shared_http_client()
+
+    def test_create_client_reuses_cached_client(self):
+        """Test _create_client returns the same client for the same configuration."""
+        router = LLMRouter()
+
+        client = router._create_client("anthropic/claude-3.5-sonnet")
+
+        assert router._create_client("anthropic/claude-3.5-sonnet") is client
+        # Clients are shared across router instances with the same settings
+        assert LLMRouter()._create_client("anthropic/claude-3.5-sonnet") is client
+        assert router._create_client("anthropic/claude-3.5-sonnet", 0.7, 2000) is client
+        assert router._create_client("openai/gpt-4o") is not client
+        assert router._create_client("anthropic/claude-3.5-sonnet", 0.2) is not client
+
+    def test_generate_keeps_zero_temperature_override(self, stub_chat):
+        """Test a falsy temperature override of 0.0 reaches the client."""
+        stub_chat.responses = [AIMessage(content="Deterministic")]
+
+        router = LLMRouter(temperature=0.7)
+        result = router.generate("Test prompt", temperature=0.0)
+
+        assert result == "Deterministic"
+        assert stub_chat.instances[0].kwargs["temperature"] == 0.0
+
+    def test_close_http_client(self):
+        """Test closing the shared HTTP client makes the next client use a fresh one."""
+        router = LLMRouter()
+        http_client = router._create_client("anthropic/claude-3.5-sonnet").http_client
+
+        close_http_client()
+
+        assert http_client.is_closed
+        new_client = router._create_client("anthropic/claude-3.5-sonnet")
+        assert new_client.http_client is not http_client
+        assert not new_client.http_client.is_closed
+
+    def test_shared_http_client_built_once_under_concurrency(self, monkeypatch):
+        """Test concurrent first calls share one HTTP client instead of each building a pool."""
+        close_http_client()
+        built = []
+
+        class SlowClient:
+            def __init__(self, **kwargs):
+                time.sleep(0.01)  # widen the race window
+                built.append(self)
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr("httpx.Client", SlowClient)
+        barrier = threading.Barrier(8)
+
+        def get_client():
+            barrier.wait()
+            return _shared_http_client()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: get_client(), range(8)))
+
+        assert len(built) == 1
+        assert all(client is built[0] for client in clients)
+        close_http_client()